@@ -1,5 +1,8 @@
 """CLI commands for station management."""
 
+import csv
+import io
+import json
 from pathlib import Path
 from typing import Any, cast
 
@@ -13,6 +16,7 @@ from rich.progress import (
 from rich.table import Table
 
 from ..crawler import StationCrawler, StationSearcher
+from ..crawler.station_crawler import REQUEST_INTERVAL
 
 console = Console()
 
@@ -48,8 +52,38 @@ def stations() -> None:
     type=int,
     help="Maximum railway lines to crawl per prefecture (default: no limit)",
 )
+@click.option(
+    "--request-interval",
+    type=float,
+    default=REQUEST_INTERVAL,
+    show_default=True,
+    help="Minimum seconds between requests to Yahoo",
+)
+@click.option(
+    "--async",
+    "use_async",
+    is_flag=True,
+    help="Fetch pages with asyncio/aiohttp instead of worker threads",
+)
+@click.option(
+    "--cache-file",
+    type=click.Path(),
+    default="data/station_details_cache.sqlite",
+    help="Cache of parsed station pages reused across crawls",
+)
+@click.option(
+    "--no-cache", is_flag=True, help="Fetch every station page, ignoring the cache"
+)
 def crawl_stations(
-    output: str, timeout: int, resume: bool, state_file: str, max_lines: int | None
+    output: str,
+    timeout: int,
+    resume: bool,
+    state_file: str,
+    max_lines: int | None,
+    request_interval: float,
+    use_async: bool,
+    cache_file: str,
+    no_cache: bool,
 ) -> None:
     """Crawl station data from Yahoo Transit with resumable functionality.
 
@@ -62,6 +96,7 @@ def crawl_stations(
 
     Use --resume to continue from a previous interrupted crawl.
     Use --max-lines to limit railway lines per prefecture (useful for testing).
+    Parsed station pages are cached for a week; use --no-cache to refetch them.
 
     Examples:
         jp-transit stations crawl
@@ -165,6 +200,7 @@ def crawl_stations(
                 timeout=timeout,
                 progress_callback=update_progress_display,
                 max_lines_per_prefecture=max_lines,
+                request_interval=request_interval,
             )
 
             # Determine resume parameters
@@ -182,6 +218,8 @@ def crawl_stations(
                 resume_from_csv=resume_csv,
                 state_file=resume_state,
                 output_path=output_path,
+                use_async=use_async,
+                details_cache_path=None if no_cache else Path(cache_file),
             )
 
             overall_progress.update(
@@ -433,8 +471,6 @@ def list_stations(
 
         # Output in requested format
         if output_format == "json":
-            import json
-
             station_data = [
                 {
                     "name": s.name,
@@ -454,9 +490,6 @@ def list_stations(
             console.print(json.dumps(station_data, ensure_ascii=False, indent=2))
 
         elif output_format == "csv":
-            import csv
-            import io
-
             output = io.StringIO()
             fieldnames = [
                 "name",
@@ -114,13 +114,20 @@ class YahooTransitScraper:
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
+            # Yahoo serves UTF-8. Without a declared charset requests falls back
+            # to ISO-8859-1 for text/* responses (or runs its detector for
+            # others), so decode as UTF-8 unless the server names a charset.
+            if "charset" not in response.headers.get("content-type", "").lower():
+                response.encoding = "utf-8"
+            html_content = response.text
+
             # Check if we got a valid response
-            if "経路が見つかりませんでした" in response.text:
+            if "経路が見つかりませんでした" in html_content:
                 raise RouteNotFoundError(
                     f"No route found from {request.from_station} to {request.to_station}"
                 )
 
-            return response.text
+            return html_content
 
         except requests.exceptions.RequestException as e:
             raise NetworkError(f"Failed to fetch route data: {str(e)}") from e
@@ -1,25 +1,133 @@
 """Station data crawler for building station database."""
 
+import asyncio
 import csv
+import hashlib
+import heapq
 import json
 import logging
+import os
+import pickle
+import re
+import sqlite3
+import sys
+import threading
 import time
-from collections.abc import Callable
-from dataclasses import dataclass, field
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
+from urllib.parse import parse_qs, unquote, urlparse
 
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+from urllib3.util.retry import Retry
 
 from ..core.exceptions import NetworkError, ScrapingError
 from ..core.models import Station
 from ..utils.japanese_text import generate_text_variants
+from ..utils.json_compat import json_dumps, json_loads
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    SELECTOLAX_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+YAHOO_TRANSIT_BASE_URL = "https://transit.yahoo.co.jp"
+
+# Request headers shared by the requests and aiohttp sessions
+CRAWLER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Accept-Encoding": "gzip, deflate",
+    "Connection": "keep-alive",
+}
+
+# Connection pool size per host
+HTTP_POOL_SIZE = 32
+
+# HTTP statuses worth retrying at the connection level
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Concurrent line pages crawled per prefecture
+LINE_CRAWL_WORKERS = 4
+
+# Concurrent station detail fetches per line page
+DETAIL_FETCH_WORKERS = 8
+
+# Default minimum spacing between requests to Yahoo (1 request/second). All
+# crawler requests share one limiter and go to one host, so this is the
+# per-host rate; StationCrawler(request_interval=...) can lower it.
+REQUEST_INTERVAL = 1.0
+
+# Request spacing backs off multiplicatively when Yahoo throttles us, up to
+# the maximum, and recovers additively on each successful response
+REQUEST_INTERVAL_MAX = 5.0
+REQUEST_INTERVAL_BACKOFF = 2.0
+REQUEST_INTERVAL_RECOVERY = 0.01
+
+# Station CSV columns, in file order
+STATION_CSV_FIELDNAMES = (
+    "name",
+    "name_hiragana",
+    "name_katakana",
+    "name_romaji",
+    "prefecture",
+    "prefecture_id",
+    "station_id",
+    "railway_company",
+    "line_name",
+    "aliases",
+    "all_lines",
+)
+
+# Bump when Station changes in a way its JSON schema does not show (e.g. a
+# changed validator), so pickled station caches are rebuilt
+STATION_CACHE_VERSION = 1
+
+
+# Write buffer for station CSVs, so rows reach disk in large chunks
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Minimum seconds between mid-prefecture crawl state saves
+STATE_SAVE_INTERVAL = 10.0
+
+# Seconds before a cached station details entry is fetched again (one week)
+DETAILS_CACHE_TTL = 7 * 24 * 60 * 60
+
+# Bytes read per chunk when stream-parsing a page
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Retries for transient failures on the asyncio crawl path, mirroring the
+# requests adapter's policy
+ASYNC_FETCH_RETRIES = 3
+
+# Longest n-gram kept in the station search substring index
+SEARCH_NGRAM_SIZE = 3
+
+# Yahoo station pages live at /station/{numeric id}
+_STATION_ID_RE = re.compile(r"/station/(\d+)")
+# Station page titles look like "青山(岩手県)駅の駅周辺情報"
+_TITLE_STATION_RE = re.compile(r"(.+?)駅の")
+# Rail section texts that mention lines without being line names
+_NON_LINE_TEXT_RE = re.compile("路線図|路線情報|線路|新幹線情報")
+
 # JIS X 0401 prefecture codes mapping
 PREFECTURE_ID_MAPPING = {
     "北海道": "01",
@@ -72,6 +180,268 @@ PREFECTURE_ID_MAPPING = {
 }
 
 
+# Railway company by line-name substring, checked in order
+_LINE_COMPANY_RULES = (
+    ("JR", "JR東日本"),
+    ("東京メトロ", "東京メトロ"),
+    ("都営", "都営地下鉄"),
+    ("小田急", "小田急電鉄"),
+    ("京急", "京浜急行電鉄"),
+)
+
+# Reverse lookup from zero-padded prefecture code ("01") to prefecture name
+_PREFECTURE_NAME_BY_ID = {
+    pref_id: name for name, pref_id in PREFECTURE_ID_MAPPING.items()
+}
+
+# Prefecture code path segment in Yahoo URLs, padded (/01/) or not (/1/)
+_PREF_URL_RE = re.compile(r"/(\d{1,2})(?=/)")
+
+
+def _rail_names_from_detail(detail: dict[str, Any]) -> list[str]:
+    """Get the names of all lines serving a station from its Next.js detail data.
+
+    Args:
+        detail: ``lipFeature.TransitSearchInfo.Detail`` object of a station page
+
+    Returns:
+        Rail names in page order (may contain repeats), empty if unavailable
+    """
+    station_info = detail.get("StationInfo")
+    if not isinstance(station_info, dict):
+        return []
+    rail_groups = station_info.get("RailGroup")
+    if not isinstance(rail_groups, list):
+        return []
+    return [
+        group["RailName"]
+        for group in rail_groups
+        if isinstance(group, dict) and group.get("RailName")
+    ]
+
+
+def _make_soup(content: bytes, parse_only: SoupStrainer | None = None) -> BeautifulSoup:
+    """Parse page bytes with lxml, falling back to the stdlib parser.
+
+    Passing bytes lets the parser pick up the document's declared charset
+    instead of relying on requests' encoding guess.
+
+    Args:
+        content: Raw HTML bytes
+        parse_only: Optional strainer limiting which elements are built
+
+    Returns:
+        Parsed BeautifulSoup document
+    """
+    try:
+        return BeautifulSoup(content, "lxml", parse_only=parse_only)
+    except FeatureNotFound:  # pragma: no cover - lxml is a core dependency
+        return BeautifulSoup(content, "html.parser", parse_only=parse_only)
+
+
+# Station links on line pages carry the station's pref/company/line parameters
+_STATION_LINK_PARTS = ("/station/", "pref=", "company=")
+
+
+def _extract_anchors(
+    content: bytes, href_contains: tuple[str, ...] = ()
+) -> list[tuple[str, str]]:
+    """Extract ``(href, text)`` pairs for anchors whose href matches.
+
+    Uses the selectolax (lexbor) C parser when it is installed, which skips
+    building a BeautifulSoup tree entirely. Falls back to BeautifulSoup with
+    the lxml parser if selectolax is missing or rejects the page. In both
+    cases the href filter runs inside the parser rather than in Python.
+
+    Args:
+        content: Raw HTML bytes
+        href_contains: Substrings that must all appear in the href
+
+    Returns:
+        List of (href, stripped link text) tuples in document order
+    """
+    if SELECTOLAX_AVAILABLE:
+        selector = "a[href]" + "".join(f'[href*="{part}"]' for part in href_contains)
+        try:
+            tree = LexborHTMLParser(content)
+            return [
+                (node.attributes.get("href") or "", node.text().strip())
+                for node in tree.css(selector)
+            ]
+        except (ValueError, RuntimeError) as e:
+            logger.debug(f"selectolax failed to parse page, using lxml: {e}")
+
+    def href_matches(href: str | None) -> bool:
+        return href is not None and all(part in href for part in href_contains)
+
+    soup = _make_soup(content, parse_only=SoupStrainer("a", href=href_matches))
+    return [
+        (str(link.get("href", "")), link.get_text().strip())
+        for link in soup.find_all("a", href=True)
+    ]
+
+
+@dataclass
+class _StationPage:
+    """The parts of a station page that the crawler reads."""
+
+    title: str | None
+    kana: str | None
+    next_data: str | None
+    # Lazily scanned link and <dt> texts of the rail section; only consumed
+    # when the JSON payload has no rail groups
+    rail_texts: Iterable[str]
+
+
+def _read_station_page(content: bytes) -> _StationPage:
+    """Pull the title, kana, Next.js payload and rail texts from a station page.
+
+    Like ``_extract_anchors``, uses selectolax (lexbor) when installed and
+    falls back to BeautifulSoup with lxml otherwise.
+
+    Args:
+        content: Raw station page HTML
+
+    Returns:
+        Extracted station page parts
+    """
+    if SELECTOLAX_AVAILABLE:
+        try:
+            tree = LexborHTMLParser(content)
+        except (ValueError, RuntimeError) as e:
+            logger.debug(f"selectolax failed to parse page, using lxml: {e}")
+        else:
+            title = tree.css_first("title")
+            kana = tree.css_first("span.staKana")
+            next_data = tree.css_first("script#__NEXT_DATA__")
+            rail_section = tree.css_first("#mdStaRail") or tree
+            return _StationPage(
+                title=title.text() if title else None,
+                kana=kana.text() if kana else None,
+                next_data=next_data.text() if next_data else None,
+                rail_texts=(node.text() for node in rail_section.css("a[href], dt")),
+            )
+
+    soup = _make_soup(content)
+    title_elem = soup.find("title")
+    kana_elem = soup.find("span", class_="staKana")
+    next_data_elem = soup.find("script", id="__NEXT_DATA__")
+    soup_section = soup.select_one("#mdStaRail") or soup
+    return _StationPage(
+        title=title_elem.get_text() if title_elem else None,
+        kana=kana_elem.get_text() if kana_elem else None,
+        next_data=next_data_elem.string if next_data_elem else None,
+        rail_texts=(elem.get_text() for elem in soup_section.select("a[href], dt")),
+    )
+
+
+def _iter_streamed_anchors(
+    chunks: Iterable[bytes], href_contains: tuple[str, ...] = ()
+) -> Iterator[tuple[str, str]]:
+    """Yield ``(href, text)`` pairs for anchors as HTML chunks arrive.
+
+    Feeds the chunks to lxml's incremental HTML parser, so matching links are
+    produced while the page is still downloading and callers can stop
+    reading once they have what they need. Each anchor is cleared after use
+    to keep the partial tree small. Yahoo serves UTF-8 but its listing
+    pages do not always declare a charset early enough for lxml, which
+    would then fall back to Latin-1, so the encoding is given explicitly.
+
+    Args:
+        chunks: Raw HTML in byte chunks, e.g. ``response.iter_content()``
+        href_contains: Substrings that must all appear in the href
+
+    Yields:
+        (href, stripped link text) tuples in document order
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="a", encoding="utf-8")
+
+    def drain() -> Iterator[tuple[str, str]]:
+        for _event, element in parser.read_events():
+            href = element.get("href")
+            if href is not None and all(part in href for part in href_contains):
+                yield href, "".join(element.itertext()).strip()
+            element.clear(keep_tail=True)
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
+def _station_key(station_id: str | None, name: str, prefecture: str | None) -> int:
+    """Build the integer dedup key for a station.
+
+    Numeric Yahoo station IDs are used as-is. Stations without one are keyed
+    by a 64-bit hash of name and prefecture with the top bit set, so they can
+    never collide with a real ID. Storing ints rather than strings keeps the
+    dedup set small for a nationwide crawl.
+
+    Args:
+        station_id: Yahoo station ID, if known
+        name: Station name
+        prefecture: Prefecture name
+
+    Returns:
+        Dedup key
+    """
+    if station_id and station_id.isdigit():
+        return int(station_id)
+    source = station_id or f"{name}\x00{prefecture or ''}"
+    digest = hashlib.blake2b(source.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") | (1 << 63)
+
+
+@lru_cache(maxsize=8192)
+def _parse_station_href(station_href: str) -> tuple[str, str, str]:
+    """Parse the pref/company/line query parameters of a station link.
+
+    Transfer stations are linked from every line they serve, so the same
+    href is parsed many times per crawl; the cache skips the repeat work.
+
+    Args:
+        station_href: Station link href
+
+    Returns:
+        Tuple of (pref, company, line), empty strings when absent
+    """
+    params = parse_qs(urlparse(station_href).query)
+    return (
+        params.get("pref", [""])[0],
+        params.get("company", [""])[0],
+        params.get("line", [""])[0],
+    )
+
+
+def _station_row(station: Station) -> tuple[str, ...]:
+    """Convert a station to a CSV row ordered like ``STATION_CSV_FIELDNAMES``."""
+    return (
+        station.name,
+        station.name_hiragana or "",
+        station.name_katakana or "",
+        station.name_romaji or "",
+        station.prefecture or "",
+        station.prefecture_id or "",
+        station.station_id or "",
+        station.railway_company or "",
+        station.line_name or "",
+        "|".join(station.aliases) if station.aliases else "",
+        "|".join(station.all_lines) if station.all_lines else "",
+    )
+
+
+@lru_cache(maxsize=1)
+def _station_cache_key() -> tuple[int, tuple[str, ...], str]:
+    """Identify the station layout and model a pickled station cache holds."""
+    schema = json.dumps(Station.model_json_schema(), sort_keys=True)
+    return (
+        STATION_CACHE_VERSION,
+        STATION_CSV_FIELDNAMES,
+        hashlib.sha256(schema.encode()).hexdigest(),
+    )
+
+
 @dataclass
 class CrawlState:
     """State for resumable crawling."""
@@ -152,6 +522,137 @@ class CrawlingProgress:
         return progress
 
 
+class RateLimiter:
+    """Thread-safe limiter spacing requests at least ``interval`` seconds apart.
+
+    The spacing adapts to the server (AIMD): ``record`` widens it when a
+    response shows throttling and narrows it back towards the configured
+    minimum on success.
+    """
+
+    def __init__(self, interval: float, max_interval: float = REQUEST_INTERVAL_MAX):
+        """Initialize the rate limiter.
+
+        Args:
+            interval: Minimum number of seconds between two requests
+            max_interval: Upper bound for the backed-off spacing
+        """
+        self.min_interval = interval
+        self.max_interval = max(interval, max_interval)
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def _reserve(self) -> float:
+        """Reserve the next request slot.
+
+        Returns:
+            Seconds to wait before the slot starts
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        return wait
+
+    def acquire(self) -> None:
+        """Block until the caller may issue its next request."""
+        # Sleep outside the lock so other threads can reserve their slots
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until the next request."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def record(self, throttled: bool) -> None:
+        """Adapt the spacing to the outcome of a request.
+
+        Args:
+            throttled: Whether the server answered with a throttling or
+                transient error status (see ``RETRY_STATUS_CODES``)
+        """
+        with self._lock:
+            if throttled:
+                self.interval = min(
+                    self.interval * REQUEST_INTERVAL_BACKOFF, self.max_interval
+                )
+            elif self.interval > self.min_interval:
+                self.interval = max(
+                    self.interval - REQUEST_INTERVAL_RECOVERY, self.min_interval
+                )
+
+
+class StationDetailsCache:
+    """On-disk SQLite cache of parsed station details, keyed by station href.
+
+    Lets a repeated crawl skip fetching and parsing station pages it has
+    seen recently. The connection is shared by the line worker threads,
+    so access is serialized with a lock.
+    """
+
+    def __init__(self, path: Path, ttl: float = DETAILS_CACHE_TTL):
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds before an entry expires
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL with relaxed syncing keeps per-entry commits cheap
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS station_details ("
+            "href TEXT PRIMARY KEY, fetched_at REAL NOT NULL, details BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, station_href: str) -> StationDetails | None:
+        """Get cached details for a station link.
+
+        Args:
+            station_href: Station page href
+
+        Returns:
+            Cached details, or None when missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, details FROM station_details WHERE href = ?",
+                (station_href,),
+            ).fetchone()
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        return StationDetails(**json_loads(row[1]))
+
+    def put(self, station_href: str, details: StationDetails) -> None:
+        """Store parsed details for a station link.
+
+        Args:
+            station_href: Station page href
+            details: Details parsed from the station page
+        """
+        data = json_dumps(asdict(details))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO station_details VALUES (?, ?, ?)",
+                (station_href, time.time(), data),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
 class StationCrawler:
     """Crawler for Japanese train station data."""
 
@@ -160,6 +661,7 @@ class StationCrawler:
         timeout: int = 30,
         progress_callback: Callable[[dict[str, Any]], None] | None = None,
         max_lines_per_prefecture: int | None = None,
+        request_interval: float = REQUEST_INTERVAL,
     ):
         """Initialize the station crawler.
 
@@ -167,19 +669,45 @@ class StationCrawler:
             timeout: Request timeout in seconds
             progress_callback: Optional callback for progress updates
             max_lines_per_prefecture: Maximum lines to crawl per prefecture (None for no limit)
+            request_interval: Minimum seconds between two requests to Yahoo
         """
         self.timeout = timeout
         self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
+        self.session.headers.update(CRAWLER_HEADERS)
+        # Keep connections alive across the thousands of page fetches and
+        # retry transient failures without re-establishing TLS
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=RETRY_STATUS_CODES,
+                allowed_methods=frozenset(["GET"]),
+                respect_retry_after_header=True,
+                # Hand the final response back so callers' status checks apply
+                raise_on_status=False,
+            ),
         )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.rate_limiter = RateLimiter(request_interval)
+        self.session.hooks["response"].append(self._record_response)
+        self.max_workers = DETAIL_FETCH_WORKERS
+        self.line_workers = LINE_CRAWL_WORKERS
+        # Fetch pages with asyncio/aiohttp instead of worker threads
+        self.use_async = False
+        # Guards progress and dedup state shared by concurrent line crawls
+        self._lock = threading.Lock()
         self.stations: list[Station] = []
-        self.existing_stations: set[str] = set()  # For deduplication by station_id
+        # (name, prefecture) of every station in self.stations
+        self._seen_keys: set[tuple[str, str | None]] = set()
+        self.existing_stations: set[int] = set()  # Dedup keys, see _station_key
         self.progress = CrawlingProgress()
         self.progress_callback = progress_callback
         self.state_file: Path | None = None
+        self._last_state_save = 0.0
+        self.details_cache: StationDetailsCache | None = None
         self.output_path: Path | None = None
         self.checkpoint_interval = 50  # Save progress every 50 stations
         self.max_lines_per_prefecture = max_lines_per_prefecture
@@ -189,6 +717,8 @@ class StationCrawler:
         resume_from_csv: Path | None = None,
         state_file: Path | None = None,
         output_path: Path | None = None,
+        use_async: bool = False,
+        details_cache_path: Path | None = None,
     ) -> list[Station]:
         """Crawl station data from multiple sources with resume capability.
 
@@ -196,13 +726,22 @@ class StationCrawler:
             resume_from_csv: Path to existing CSV file to resume from
             state_file: Path to state file for tracking progress
             output_path: Path to output CSV file for incremental writing
+            use_async: Fetch pages on a single asyncio event loop with aiohttp
+                instead of worker threads
+            details_cache_path: SQLite file caching parsed station pages
+                between runs; None fetches every station page
 
         Returns:
-            List of Station objects
+            List of Station objects. Empty when ``output_path`` is given: the
+            stations are then written to the CSV as they are found rather than
+            kept in memory.
         """
         logger.info("Starting resumable station data crawl")
         self.state_file = state_file
         self.output_path = output_path
+        self.use_async = use_async
+        if details_cache_path:
+            self.details_cache = StationDetailsCache(details_cache_path)
 
         # Load existing stations for deduplication
         if resume_from_csv and resume_from_csv.exists():
@@ -221,32 +760,45 @@ class StationCrawler:
         crawl_state = self._load_crawl_state()
 
         self.stations = []
+        self._seen_keys = set()
         self._update_progress("Starting crawl...")
 
         try:
             # Crawl Yahoo Transit stations with resume capability
             self._crawl_yahoo_transit_stations_resumable(crawl_state)
 
-            # Remove duplicates and return
-            unique_stations = self._deduplicate_stations()
+            if output_path:
+                # Stations were streamed to the CSV instead of kept in memory
+                unique_stations = []
+                logger.info(
+                    f"Crawled {self.progress.stations_found} unique stations into {output_path}"
+                )
+            else:
+                # Stations were deduplicated as they were collected
+                unique_stations = self._deduplicate_stations()
+                self.progress.stations_found = len(unique_stations)
+                logger.info(f"Crawled {len(unique_stations)} unique stations")
 
             # Update final progress
-            self.progress.stations_found = len(unique_stations)
             self._update_progress("Crawling completed!")
 
             # Clean up state file on successful completion
             if self.state_file and self.state_file.exists():
                 self.state_file.unlink()
 
-            logger.info(f"Crawled {len(unique_stations)} unique stations")
             return unique_stations
 
-        except Exception as e:
+        except (Exception, KeyboardInterrupt) as e:
             # Save current state before re-raising
             self._save_crawl_state(crawl_state)
             logger.error(f"Crawling interrupted: {e}")
             raise
 
+        finally:
+            if self.details_cache:
+                self.details_cache.close()
+                self.details_cache = None
+
     def save_to_csv(self, stations: list[Station], file_path: Path) -> None:
         """Save stations to CSV file.
 
@@ -256,41 +808,17 @@ class StationCrawler:
         """
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w", newline="", encoding="utf-8") as csvfile:
-            fieldnames = [
-                "name",
-                "name_hiragana",
-                "name_katakana",
-                "name_romaji",
-                "prefecture",
-                "prefecture_id",
-                "station_id",
-                "railway_company",
-                "line_name",
-                "aliases",
-                "all_lines",
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-
-            writer.writeheader()
-            for station in stations:
-                writer.writerow(
-                    {
-                        "name": station.name,
-                        "name_hiragana": station.name_hiragana or "",
-                        "name_katakana": station.name_katakana or "",
-                        "name_romaji": station.name_romaji or "",
-                        "prefecture": station.prefecture or "",
-                        "prefecture_id": station.prefecture_id or "",
-                        "station_id": station.station_id or "",
-                        "railway_company": station.railway_company or "",
-                        "line_name": station.line_name or "",
-                        "aliases": "|".join(station.aliases) if station.aliases else "",
-                        "all_lines": "|".join(station.all_lines)
-                        if station.all_lines
-                        else "",
-                    }
-                )
+        with open(
+            file_path,
+            "w",
+            newline="",
+            encoding="utf-8",
+            buffering=CSV_WRITE_BUFFER_SIZE,
+        ) as csvfile:
+            writer = csv.writer(csvfile)
+
+            writer.writerow(STATION_CSV_FIELDNAMES)
+            writer.writerows(_station_row(station) for station in stations)
 
         logger.info(f"Saved {len(stations)} stations to {file_path}")
 
@@ -306,43 +834,19 @@ class StationCrawler:
         # Check if file exists to determine if we need headers
         write_headers = not file_path.exists()
 
-        with open(file_path, "a", newline="", encoding="utf-8") as csvfile:
-            fieldnames = [
-                "name",
-                "name_hiragana",
-                "name_katakana",
-                "name_romaji",
-                "prefecture",
-                "prefecture_id",
-                "station_id",
-                "railway_company",
-                "line_name",
-                "aliases",
-                "all_lines",
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        with open(
+            file_path,
+            "a",
+            newline="",
+            encoding="utf-8",
+            buffering=CSV_WRITE_BUFFER_SIZE,
+        ) as csvfile:
+            writer = csv.writer(csvfile)
 
             if write_headers:
-                writer.writeheader()
-
-            for station in stations:
-                writer.writerow(
-                    {
-                        "name": station.name,
-                        "name_hiragana": station.name_hiragana or "",
-                        "name_katakana": station.name_katakana or "",
-                        "name_romaji": station.name_romaji or "",
-                        "prefecture": station.prefecture or "",
-                        "prefecture_id": station.prefecture_id or "",
-                        "station_id": station.station_id or "",
-                        "railway_company": station.railway_company or "",
-                        "line_name": station.line_name or "",
-                        "aliases": "|".join(station.aliases) if station.aliases else "",
-                        "all_lines": "|".join(station.all_lines)
-                        if station.all_lines
-                        else "",
-                    }
-                )
+                writer.writerow(STATION_CSV_FIELDNAMES)
+
+            writer.writerows(_station_row(station) for station in stations)
 
         logger.info(f"Appended {len(stations)} stations to {file_path}")
 
@@ -355,29 +859,63 @@ class StationCrawler:
         Returns:
             List of Station objects
         """
-        stations = []
+        stations: list[Station] = []
+
+        with open(file_path, encoding="utf-8", newline="") as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return stations
+            columns = {column: index for index, column in enumerate(header)}
+            width = len(header)
+
+            # Optional columns missing from older CSVs read as empty
+            def column(name: str) -> int:
+                return columns.get(name, width)
+
+            name_i = columns["name"]
+            prefecture_i = columns["prefecture"]
+            company_i = columns["railway_company"]
+            line_i = columns["line_name"]
+            hiragana_i = column("name_hiragana")
+            katakana_i = column("name_katakana")
+            romaji_i = column("name_romaji")
+            prefecture_id_i = column("prefecture_id")
+            station_id_i = column("station_id")
+            aliases_i = column("aliases")
+            all_lines_i = column("all_lines")
+
+            # Prefectures, companies and line names repeat across thousands of
+            # rows; interning lets every station share one copy of each
+            intern = sys.intern
 
-        with open(file_path, encoding="utf-8") as csvfile:
-            reader = csv.DictReader(csvfile)
             for row in reader:
-                aliases = row["aliases"].split("|") if row.get("aliases") else []
-                all_lines = row["all_lines"].split("|") if row.get("all_lines") else []
+                if len(row) <= width:
+                    row.extend([""] * (width + 1 - len(row)))
+
+                aliases = row[aliases_i].split("|") if row[aliases_i] else []
+                all_lines = (
+                    [intern(line) for line in row[all_lines_i].split("|")]
+                    if row[all_lines_i]
+                    else []
+                )
 
                 # Generate prefecture_id from prefecture name if not in CSV
-                prefecture_id = row.get("prefecture_id")
-                if not prefecture_id and row.get("prefecture"):
-                    prefecture_id = PREFECTURE_ID_MAPPING.get(row["prefecture"])
+                prefecture = intern(row[prefecture_i])
+                prefecture_id = intern(row[prefecture_id_i])
+                if not prefecture_id and prefecture:
+                    prefecture_id = PREFECTURE_ID_MAPPING.get(prefecture, "")
 
                 station = Station(
-                    name=row["name"],
-                    name_hiragana=row.get("name_hiragana") or None,
-                    name_katakana=row.get("name_katakana") or None,
-                    name_romaji=row.get("name_romaji") or None,
-                    prefecture=row["prefecture"] or None,
+                    name=row[name_i],
+                    name_hiragana=row[hiragana_i] or None,
+                    name_katakana=row[katakana_i] or None,
+                    name_romaji=row[romaji_i] or None,
+                    prefecture=prefecture or None,
                     prefecture_id=prefecture_id or None,
-                    station_id=row.get("station_id") or None,
-                    railway_company=row["railway_company"] or None,
-                    line_name=row["line_name"] or None,
+                    station_id=row[station_id_i] or None,
+                    railway_company=intern(row[company_i]) or None,
+                    line_name=intern(row[line_i]) or None,
                     aliases=aliases,
                     all_lines=all_lines,
                 )
@@ -386,6 +924,83 @@ class StationCrawler:
         logger.info(f"Loaded {len(stations)} stations from {file_path}")
         return stations
 
+    def load_from_csv_cached(
+        self, file_path: Path, write_cache: bool = True
+    ) -> list[Station]:
+        """Load stations from CSV file, reusing a pickled copy when fresh.
+
+        The parsed stations are kept in a ``.pkl`` file next to the CSV and
+        reused until the CSV is modified or the Station model changes, which
+        skips CSV parsing and model validation on repeated loads. The cache
+        is written atomically and failing to read or write it falls back to
+        the CSV.
+
+        Args:
+            file_path: Path to CSV file
+            write_cache: Write the ``.pkl`` file after parsing the CSV; pass
+                False to never modify the CSV's directory
+
+        Returns:
+            List of Station objects
+        """
+        cache_path = file_path.with_suffix(".pkl")
+        cache_key = _station_cache_key()
+        try:
+            if cache_path.stat().st_mtime >= file_path.stat().st_mtime:
+                key, stations = pickle.loads(cache_path.read_bytes())
+                # A cache written for another station layout or model is stale
+                if key == cache_key:
+                    logger.info(f"Loaded {len(stations)} stations from {cache_path}")
+                    return cast(list[Station], stations)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable station cache {cache_path}: {e}")
+
+        stations = self.load_from_csv(file_path)
+        if not write_cache:
+            return stations
+
+        try:
+            # Per-process temp name, so concurrent servers never share one
+            temp_file = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            temp_file.write_bytes(pickle.dumps((cache_key, stations), protocol=5))
+            os.replace(temp_file, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write station cache {cache_path}: {e}")
+
+        return stations
+
+    @staticmethod
+    def _iter_station_keys(
+        csv_path: Path,
+    ) -> Iterator[tuple[str | None, str, str | None]]:
+        """Yield the dedup columns of each row in a station CSV.
+
+        Reads rows as plain lists and picks columns by index, so no per-row
+        dict is built.
+
+        Args:
+            csv_path: Path to station CSV file
+
+        Yields:
+            ``(station_id, name, prefecture)`` with missing values as None
+        """
+        with open(csv_path, encoding="utf-8", newline="") as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, None)
+            if header is None:
+                return
+            name_i = header.index("name")
+            prefecture_i = header.index("prefecture") if "prefecture" in header else -1
+            station_id_i = header.index("station_id") if "station_id" in header else -1
+            for row in reader:
+                yield (
+                    row[station_id_i] or None if 0 <= station_id_i < len(row) else None,
+                    row[name_i],
+                    row[prefecture_i] or None if 0 <= prefecture_i < len(row) else None,
+                )
+
     def _load_existing_stations(self, csv_path: Path) -> None:
         """Load existing stations for deduplication.
 
@@ -393,32 +1008,47 @@ class StationCrawler:
             csv_path: Path to existing CSV file
         """
         try:
-            existing_stations = self.load_from_csv(csv_path)
+            # Only the dedup keys are needed, so skip building Station models
+            # (and splitting their alias/line columns) for every row
             # Use station_id for deduplication, fallback to name+prefecture if no ID
             self.existing_stations = {
-                s.station_id if s.station_id else f"{s.name}_{s.prefecture}"
-                for s in existing_stations
+                _station_key(station_id, name, prefecture)
+                for station_id, name, prefecture in self._iter_station_keys(csv_path)
             }
+            logger.info(
+                f"Loaded {len(self.existing_stations)} existing station keys from {csv_path}"
+            )
         except Exception as e:
             logger.warning(f"Failed to load existing stations: {e}")
             self.existing_stations = set()
 
-    def _save_crawl_state(self, state: CrawlState) -> None:
+    def _save_crawl_state(self, state: CrawlState, force: bool = True) -> None:
         """Save current crawling state to disk.
 
+        The state is written to a sibling temp file and renamed over the old
+        one, so an interrupted save never leaves a truncated state file.
+
         Args:
             state: Current crawling state
+            force: Save even if the last save was under ``STATE_SAVE_INTERVAL``
+                seconds ago
         """
         if not self.state_file:
             return
 
+        now = time.monotonic()
+        if not force and now - self._last_state_save < STATE_SAVE_INTERVAL:
+            return
+
         try:
             state_dict = state.to_dict()
             state_dict["progress"] = self.progress.to_dict()
             state_dict["timestamp"] = datetime.now().isoformat()
 
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(state_dict, f, indent=2, ensure_ascii=False)
+            temp_file = self.state_file.with_name(f"{self.state_file.name}.tmp")
+            temp_file.write_bytes(json_dumps(state_dict, indent=True))
+            os.replace(temp_file, self.state_file)
+            self._last_state_save = now
 
         except Exception as e:
             logger.warning(f"Failed to save crawl state: {e}")
@@ -433,8 +1063,7 @@ class StationCrawler:
             return CrawlState()
 
         try:
-            with open(self.state_file, encoding="utf-8") as f:
-                state = json.load(f)
+            state = json_loads(self.state_file.read_bytes())
 
             # Restore progress if available
             if "progress" in state:
@@ -460,6 +1089,13 @@ class StationCrawler:
             increment_stations: Number of stations to add to count
             station_name: Name of station being processed (for detailed logging)
         """
+        with self._lock:
+            self._report_progress(message, increment_stations, station_name)
+
+    def _report_progress(
+        self, message: str, increment_stations: int, station_name: str | None
+    ) -> None:
+        """Update progress and notify callback; caller must hold ``self._lock``."""
         if increment_stations > 0:
             self.progress.stations_found += increment_stations
 
@@ -538,9 +1174,16 @@ class StationCrawler:
 
             try:
                 pref_stations_before = self.progress.stations_found
-                self._crawl_prefecture_stations_resumable(
-                    pref["code"], pref["name"], crawl_state
-                )
+                if self.use_async:
+                    asyncio.run(
+                        self._crawl_prefecture_stations_async(
+                            pref["code"], pref["name"], crawl_state
+                        )
+                    )
+                else:
+                    self._crawl_prefecture_stations_resumable(
+                        pref["code"], pref["name"], crawl_state
+                    )
                 pref_stations_added = (
                     self.progress.stations_found - pref_stations_before
                 )
@@ -565,7 +1208,10 @@ class StationCrawler:
                 continue
 
     @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=4, max=10),
+        # Transient HTTP failures are retried by the session's adapter
+        retry=retry_if_exception_type(ScrapingError),
     )
     def _crawl_yahoo_transit_stations(self) -> None:
         """Legacy method - use _crawl_yahoo_transit_stations_resumable instead."""
@@ -584,119 +1230,509 @@ class StationCrawler:
         """
         # Remove leading zero for URL (Yahoo uses 1, 2, 3... not 01, 02, 03...)
         pref_code_for_url = str(int(pref_code))
-        pref_url = f"https://transit.yahoo.co.jp/station/pref/{pref_code_for_url}"
+        pref_url = f"{YAHOO_TRANSIT_BASE_URL}/station/pref/{pref_code_for_url}"
         logger.info(f"Fetching prefecture page: {pref_url}")
 
         try:
-            response = self.session.get(pref_url, timeout=self.timeout)
-            response.raise_for_status()
+            self.rate_limiter.acquire()
+            # Stream the listing page and parse links as the body arrives
+            response = self.session.get(pref_url, timeout=self.timeout, stream=True)
+            try:
+                response.raise_for_status()
+                line_links = self._collect_line_links(
+                    response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                    pref_code_for_url,
+                )
+            finally:
+                response.close()
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            pref_key = f"{pref_code}_{pref_name}"
+            pending_lines = self._pending_lines(
+                line_links, pref_name, pref_key, crawl_state
+            )
+            stations_batch: list[Station] = []
 
-            # Find all railway line links
-            line_links = []
-            for link in soup.find_all("a", href=True):
-                href = str(link.get("href", ""))
-                text = link.get_text().strip()
+            # Crawl lines concurrently; the shared rate limiter keeps the overall
+            # request rate polite. Results are merged here, on the calling
+            # thread, in line order.
+            with ThreadPoolExecutor(max_workers=self.line_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self._crawl_line, position, line_name, line_url, pref_name
+                    )
+                    for position, line_name, line_url, _line_key in pending_lines
+                ]
 
-                # Look for line links in format /station/{pref_code}/{company}/{line}
-                # Use unpadded code for URL matching
-                if f"/station/{pref_code_for_url}/" in href and (
-                    "線" in text or "JR" in text
+                for (position, line_name, _line_url, line_key), future in zip(
+                    pending_lines, futures, strict=True
                 ):
-                    full_url = f"https://transit.yahoo.co.jp{href}"
-                    line_links.append((text, full_url))
+                    try:
+                        line_stations = future.result()
+                    except Exception as e:
+                        self._record_line_failure(line_name, e)
+                        continue
 
-            limit_msg = (
-                f" (limited to {self.max_lines_per_prefecture})"
-                if self.max_lines_per_prefecture
-                else ""
-            )
-            logger.info(
-                f"Found {len(line_links)} railway lines in {pref_name}{limit_msg}"
-            )
+                    self._complete_line(
+                        crawl_state,
+                        pref_key,
+                        position,
+                        line_name,
+                        line_key,
+                        line_stations,
+                        stations_batch,
+                    )
 
-            # Get completed lines for this prefecture
-            pref_key = f"{pref_code}_{pref_name}"
-            completed_lines = set(crawl_state.completed_lines.get(pref_key, []))
+            self._save_final_batch(stations_batch)
 
-            stations_batch: list[Station] = []
+        except requests.RequestException as e:
+            raise NetworkError(f"Failed to fetch prefecture page: {e}") from e
+        except Exception as e:
+            raise ScrapingError(f"Failed to parse prefecture page: {e}") from e
 
-            # Crawl each line (with configurable limit)
-            if self.max_lines_per_prefecture is not None:
-                line_links = line_links[: self.max_lines_per_prefecture]
+    def _collect_line_links(
+        self, chunks: Iterable[bytes], pref_code_for_url: str
+    ) -> list[tuple[str, str]]:
+        """Collect railway line links from a prefecture listing page.
 
-            for line_idx, (line_name, line_url) in enumerate(line_links, 1):
-                line_key = f"{line_name}_{line_url}"
+        Stops reading the page once ``max_lines_per_prefecture`` links have
+        been found.
 
-                if line_key in completed_lines:
-                    logger.info(f"Skipping already completed line: {line_name}")
-                    continue
+        Args:
+            chunks: Raw page HTML in byte chunks
+            pref_code_for_url: Unpadded prefecture code used in Yahoo URLs
 
-                self.progress.current_line = line_name
-                self._update_progress(
-                    f"[{line_idx:2d}/{len(line_links)}] Crawling line: {line_name}"
-                )
+        Returns:
+            List of (line name, absolute line URL) tuples
+        """
+        # Find all railway line links
+        line_links: list[tuple[str, str]] = []
+        if self.max_lines_per_prefecture == 0:
+            return line_links
+
+        # Look for line links in format /station/{pref_code}/{company}/{line}
+        # Use unpadded code for URL matching
+        for href, text in _iter_streamed_anchors(
+            chunks, (f"/station/{pref_code_for_url}/",)
+        ):
+            if "線" in text or "JR" in text:
+                full_url = f"{YAHOO_TRANSIT_BASE_URL}{href}"
+                line_links.append((text, full_url))
+                if len(line_links) == self.max_lines_per_prefecture:
+                    break
+        return line_links
+
+    def _pending_lines(
+        self,
+        line_links: list[tuple[str, str]],
+        pref_name: str,
+        pref_key: str,
+        crawl_state: CrawlState,
+    ) -> list[tuple[str, str, str, str]]:
+        """Pick the lines of a prefecture that still need crawling.
 
-                try:
-                    line_stations = self._parse_yahoo_line_page_resumable(
-                        line_url, line_name, pref_name
-                    )
-                    stations_batch.extend(line_stations)
-                    line_stations_added = len(line_stations)
-
-                    # Mark line as completed
-                    completed_lines.add(line_key)
-                    if pref_key not in crawl_state.completed_lines:
-                        crawl_state.completed_lines[pref_key] = []
-                    crawl_state.completed_lines[pref_key] = list(completed_lines)
-                    self.progress.lines_completed += 1
-
-                    # Update progress for completed line (stations already counted individually)
-                    self._update_progress(
-                        f"[{line_idx:2d}/{len(line_links)}] Completed line: {line_name} ({line_stations_added} stations)"
-                    )
+        Args:
+            line_links: (line name, line URL) tuples from the listing page
+            pref_name: Prefecture name
+            pref_key: Prefecture key in the crawl state
+            crawl_state: Current crawling state
+
+        Returns:
+            List of (position label, line name, line URL, line key) tuples
+        """
+        limit_msg = (
+            f" (limited to {self.max_lines_per_prefecture})"
+            if self.max_lines_per_prefecture
+            else ""
+        )
+        logger.info(f"Found {len(line_links)} railway lines in {pref_name}{limit_msg}")
+
+        # Get completed lines for this prefecture
+        completed_lines = set(crawl_state.completed_lines.get(pref_key, []))
+
+        pending_lines = []
+        for line_idx, (line_name, line_url) in enumerate(line_links, 1):
+            line_key = f"{line_name}_{line_url}"
+
+            if line_key in completed_lines:
+                logger.info(f"Skipping already completed line: {line_name}")
+                continue
+
+            position = f"[{line_idx:2d}/{len(line_links)}]"
+            pending_lines.append((position, line_name, line_url, line_key))
+
+        return pending_lines
+
+    def _record_line_failure(self, line_name: str, error: Exception) -> None:
+        """Count and report a line that could not be crawled.
+
+        Args:
+            line_name: Railway line name
+            error: Exception raised while crawling the line
+        """
+        with self._lock:
+            self.progress.errors += 1
+        self._update_progress(f"Failed to crawl line {line_name}: {error}")
+        logger.error(f"Failed to crawl line {line_name}: {error}")
+
+    def _complete_line(
+        self,
+        crawl_state: CrawlState,
+        pref_key: str,
+        position: str,
+        line_name: str,
+        line_key: str,
+        line_stations: list[Station],
+        stations_batch: list[Station],
+    ) -> None:
+        """Merge a crawled line's stations and checkpoint when the batch is full.
+
+        Args:
+            crawl_state: Current crawling state
+            pref_key: Prefecture key in the crawl state
+            position: Line position label for progress messages
+            line_name: Railway line name
+            line_key: Line key in the crawl state
+            line_stations: Stations found on the line
+            stations_batch: Unsaved stations, emptied in place on checkpoint
+        """
+        stations_batch.extend(line_stations)
+        line_stations_added = len(line_stations)
+
+        # Mark line as completed
+        completed_lines = crawl_state.completed_lines.setdefault(pref_key, [])
+        if line_key not in completed_lines:
+            completed_lines.append(line_key)
+        with self._lock:
+            self.progress.lines_completed += 1
+
+        # Update progress for completed line (stations already counted individually)
+        self._update_progress(
+            f"{position} Completed line: {line_name} ({line_stations_added} stations)"
+        )
+
+        logger.info(f"{position} Line: {line_name} → {line_stations_added} stations")
+
+        # Checkpoint save every batch or when reaching checkpoint interval
+        if len(stations_batch) >= self.checkpoint_interval:
+            self._update_progress(f"Checkpoint: saving {len(stations_batch)} stations")
+            self._flush_stations(stations_batch)
+            stations_batch.clear()
+            self._save_crawl_state(crawl_state, force=False)
+
+    def _save_final_batch(self, stations_batch: list[Station]) -> None:
+        """Save the stations left over after a prefecture's last checkpoint.
+
+        Args:
+            stations_batch: Unsaved stations
+        """
+        # Save any remaining stations
+        if stations_batch:
+            self._flush_stations(stations_batch)
+            self._update_progress(f"Final batch: saved {len(stations_batch)} stations")
+
+    def _flush_stations(self, stations_batch: list[Station]) -> None:
+        """Hand a batch of crawled stations to the output.
+
+        With an output path the batch is only appended to the CSV, which is
+        the source of truth, so memory stays flat over a full crawl.
+        Otherwise the stations are collected in ``self.stations``.
+
+        Args:
+            stations_batch: Stations to save (already deduplicated)
+        """
+        if self.output_path:
+            self._checkpoint_save(stations_batch, self.output_path)
+        else:
+            self._collect_stations(stations_batch)
+
+    def _collect_stations(self, stations: Iterable[Station]) -> None:
+        """Add stations to ``self.stations``, skipping name/prefecture repeats.
+
+        Args:
+            stations: Stations to add
+        """
+        for station in stations:
+            key = (station.name, station.prefecture)
+            if key not in self._seen_keys:
+                self._seen_keys.add(key)
+                self.stations.append(station)
+
+    def _crawl_line(
+        self, position: str, line_name: str, line_url: str, pref_name: str
+    ) -> list[Station]:
+        """Crawl a single line page; runs on a line worker thread.
+
+        Args:
+            position: Line position label for progress messages (e.g. '[ 3/20]')
+            line_name: Railway line name
+            line_url: Yahoo Transit line page URL
+            pref_name: Prefecture name
+
+        Returns:
+            List of new stations found on the line
+        """
+        with self._lock:
+            self.progress.current_line = line_name
+        self._update_progress(f"{position} Crawling line: {line_name}")
+        return self._parse_yahoo_line_page_resumable(line_url, line_name, pref_name)
+
+    async def _crawl_prefecture_stations_async(
+        self, pref_code: str, pref_name: str, crawl_state: CrawlState
+    ) -> None:
+        """Crawl all railway lines in a prefecture on an asyncio event loop.
+
+        Same results and checkpointing as
+        ``_crawl_prefecture_stations_resumable``, but every page is fetched
+        through one aiohttp session. HTML parsing, details cache access and
+        checkpoint writes run in worker threads so they do not stall the loop.
+
+        Args:
+            pref_code: Prefecture code (e.g., '13' for Tokyo)
+            pref_name: Prefecture name (e.g., '東京都')
+            crawl_state: Current crawling state
+        """
+        pref_code_for_url = str(int(pref_code))
+        pref_url = f"{YAHOO_TRANSIT_BASE_URL}/station/pref/{pref_code_for_url}"
+        logger.info(f"Fetching prefecture page: {pref_url}")
 
-                    logger.info(
-                        f"[{line_idx:2d}/{len(line_links)}] Line: {line_name} → {line_stations_added} stations"
+        try:
+            async with self._open_async_session() as session:
+                status, content = await self._fetch_async(session, pref_url)
+                if status != 200:
+                    raise NetworkError(f"HTTP {status} for {pref_url}")
+                line_links = await asyncio.to_thread(
+                    self._collect_line_links, [content], pref_code_for_url
+                )
+
+                pref_key = f"{pref_code}_{pref_name}"
+                pending_lines = self._pending_lines(
+                    line_links, pref_name, pref_key, crawl_state
+                )
+                stations_batch: list[Station] = []
+
+                line_slots = asyncio.Semaphore(self.line_workers)
+                detail_slots = asyncio.Semaphore(self.max_workers)
+                tasks = [
+                    asyncio.ensure_future(
+                        self._crawl_line_async(
+                            session,
+                            line_slots,
+                            detail_slots,
+                            position,
+                            line_name,
+                            line_url,
+                            pref_name,
+                        )
                     )
+                    for position, line_name, line_url, _line_key in pending_lines
+                ]
 
-                    # Checkpoint save every batch or when reaching checkpoint interval
-                    if len(stations_batch) >= self.checkpoint_interval:
-                        self._update_progress(
-                            f"Checkpoint: saving {len(stations_batch)} stations"
+                try:
+                    # Merge in line order, as in the threaded crawl
+                    for (position, line_name, _line_url, line_key), task in zip(
+                        pending_lines, tasks, strict=True
+                    ):
+                        try:
+                            line_stations = await task
+                        except Exception as e:
+                            self._record_line_failure(line_name, e)
+                            continue
+
+                        await asyncio.to_thread(
+                            self._complete_line,
+                            crawl_state,
+                            pref_key,
+                            position,
+                            line_name,
+                            line_key,
+                            line_stations,
+                            stations_batch,
                         )
-                        # Write batch to CSV if output path is provided
-                        if self.output_path:
-                            self._checkpoint_save(stations_batch, self.output_path)
-                        self.stations.extend(stations_batch)
-                        stations_batch = []
-                        self._save_crawl_state(crawl_state)
-
-                    # Add delay to be respectful
-                    time.sleep(1)
-
-                except Exception as e:
-                    self.progress.errors += 1
-                    self._update_progress(f"Failed to crawl line {line_name}: {e}")
-                    logger.error(f"Failed to crawl line {line_name}: {e}")
-                    continue
+                finally:
+                    # If merging failed, stop the remaining lines before the
+                    # session they fetch with is closed
+                    for task in tasks:
+                        task.cancel()
+                    await asyncio.gather(*tasks, return_exceptions=True)
 
-            # Save any remaining stations
-            if stations_batch:
-                # Write final batch to CSV if output path is provided
-                if self.output_path:
-                    self._checkpoint_save(stations_batch, self.output_path)
-                self.stations.extend(stations_batch)
-                self._update_progress(
-                    f"Final batch: saved {len(stations_batch)} stations"
-                )
+            await asyncio.to_thread(self._save_final_batch, stations_batch)
 
-        except requests.RequestException as e:
+        except NetworkError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             raise NetworkError(f"Failed to fetch prefecture page: {e}") from e
         except Exception as e:
             raise ScrapingError(f"Failed to parse prefecture page: {e}") from e
 
+    def _open_async_session(self) -> aiohttp.ClientSession:
+        """Create an aiohttp session with the crawler's headers and timeout.
+
+        Returns:
+            Client session with pooled keep-alive connections
+        """
+        return aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=HTTP_POOL_SIZE, keepalive_timeout=60),
+            headers=CRAWLER_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    def _record_response(
+        self, response: requests.Response, *args: Any, **kwargs: Any
+    ) -> None:
+        """Session response hook feeding request outcomes to the rate limiter.
+
+        Statuses retried inside the HTTP adapter never reach requests, so the
+        adapter's retry history is checked as well.
+
+        Args:
+            response: Response to a crawler request
+            *args: Unused hook arguments
+            **kwargs: Unused hook arguments
+        """
+        retries = getattr(response.raw, "retries", None)
+        history = retries.history if retries else ()
+        self.rate_limiter.record(
+            response.status_code in RETRY_STATUS_CODES
+            or any(attempt.status in RETRY_STATUS_CODES for attempt in history)
+        )
+
+    async def _fetch_async(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> tuple[int, bytes]:
+        """Fetch a page, retrying transient failures.
+
+        Args:
+            session: aiohttp client session
+            url: Page URL
+
+        Returns:
+            HTTP status and body; the body is empty unless the status is 200
+        """
+        attempt = 0
+        while True:
+            await self.rate_limiter.acquire_async()
+            try:
+                async with session.get(url) as response:
+                    self.rate_limiter.record(response.status in RETRY_STATUS_CODES)
+                    if (
+                        response.status not in RETRY_STATUS_CODES
+                        or attempt == ASYNC_FETCH_RETRIES
+                    ):
+                        content = (
+                            await response.read() if response.status == 200 else b""
+                        )
+                        return response.status, content
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == ASYNC_FETCH_RETRIES:
+                    raise
+            await asyncio.sleep(2**attempt)
+            attempt += 1
+
+    async def _crawl_line_async(
+        self,
+        session: aiohttp.ClientSession,
+        line_slots: asyncio.Semaphore,
+        detail_slots: asyncio.Semaphore,
+        position: str,
+        line_name: str,
+        line_url: str,
+        pref_name: str,
+    ) -> list[Station]:
+        """Crawl a single line page on the event loop.
+
+        Args:
+            session: aiohttp client session
+            line_slots: Semaphore bounding concurrent line crawls
+            detail_slots: Semaphore bounding concurrent station page fetches
+            position: Line position label for progress messages (e.g. '[ 3/20]')
+            line_name: Railway line name
+            line_url: Yahoo Transit line page URL
+            pref_name: Prefecture name
+
+        Returns:
+            List of new stations found on the line
+        """
+        async with line_slots:
+            with self._lock:
+                self.progress.current_line = line_name
+            self._update_progress(f"{position} Crawling line: {line_name}")
+
+            try:
+                status, content = await self._fetch_async(session, line_url)
+                if status != 200:
+                    raise NetworkError(f"HTTP {status} for {line_url}")
+
+                station_prefecture, new_links = await asyncio.to_thread(
+                    self._claim_new_station_links, content, line_url, pref_name
+                )
+                all_details = await asyncio.gather(
+                    *(
+                        self._get_station_details_async(
+                            session, detail_slots, station_href
+                        )
+                        for _, station_href, _ in new_links
+                    )
+                )
+                return await asyncio.to_thread(
+                    self._build_line_stations,
+                    new_links,
+                    list(all_details),
+                    line_name,
+                    station_prefecture,
+                )
+
+            except NetworkError:
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise NetworkError(f"Failed to fetch Yahoo Transit page: {e}") from e
+            except Exception as e:
+                raise ScrapingError(f"Failed to parse Yahoo Transit page: {e}") from e
+
+    async def _get_station_details_async(
+        self,
+        session: aiohttp.ClientSession,
+        detail_slots: asyncio.Semaphore,
+        station_href: str,
+    ) -> StationDetails:
+        """Get detailed station information from station page on the event loop.
+
+        Args:
+            session: aiohttp client session
+            detail_slots: Semaphore bounding concurrent station page fetches
+            station_href: Station page href
+
+        Returns:
+            Station details
+        """
+        details_cache = self.details_cache
+        if details_cache:
+            cached = await asyncio.to_thread(details_cache.get, station_href)
+            if cached is not None:
+                return cached
+
+        details = StationDetails()
+
+        try:
+            station_url, details, link_info = self._station_url_and_details(
+                station_href
+            )
+
+            async with detail_slots:
+                status, content = await self._fetch_async(session, station_url)
+            if status == 200:
+
+                def parse_and_cache() -> None:
+                    self._parse_station_page(details, station_url, content, link_info)
+                    if details_cache:
+                        details_cache.put(station_href, details)
+
+                await asyncio.to_thread(parse_and_cache)
+
+        except Exception as e:
+            logger.debug(f"Failed to get station details: {e}")
+
+        return details
+
     def _crawl_prefecture_stations(self, pref_code: str, pref_name: str) -> None:
         """Legacy method - use _crawl_prefecture_stations_resumable instead."""
         crawl_state = CrawlState()
@@ -713,45 +1749,40 @@ class StationCrawler:
             prefecture: Prefecture name
         """
         try:
+            self.rate_limiter.acquire()
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
-
             # Look for station links - Yahoo uses pattern /station/{id}?pref={pref}&company={company}&line={line}
             station_links = []
-            stations_found = []
-
-            for link in soup.find_all("a", href=True):
-                href = str(link.get("href", ""))
-                text = link.get_text().strip()
-
-                # Look for station links with query parameters
-                if (
-                    "/station/" in href
-                    and "pref=" in href
-                    and "company=" in href
-                    and text
-                ):
-                    # Filter out non-station links
-                    if text not in ["駅情報", "時刻表"] and len(text) <= 15:
-                        station_links.append((text, href))
+            stations_found: set[str] = set()
+
+            # Look for station links with query parameters
+            for href, text in _extract_anchors(response.content, _STATION_LINK_PARTS):
+                # Filter out non-station links
+                if text and text not in ["駅情報", "時刻表"] and len(text) <= 15:
+                    station_links.append((text, href))
+
+            # Get prefecture from URL or parameter
+            station_prefecture = prefecture or self._get_prefecture_from_url(url)
+
+            # Determine railway company from line name
+            railway_company = self._get_company_from_line(line_name)
 
             # Extract detailed station information
             for station_name, station_href in station_links:
                 if station_name in stations_found:
                     continue  # Skip duplicates
 
-                stations_found.append(station_name)
+                # Check for known stations before fetching any details
+                station_id_match = _STATION_ID_RE.search(station_href)
+                station_id = station_id_match.group(1) if station_id_match else None
+                station_key = _station_key(station_id, station_name, station_prefecture)
 
-                # Extract additional info from URL parameters
-                self._extract_station_info_from_url(station_href, url)
-
-                # Get prefecture from URL or parameter
-                station_prefecture = prefecture or self._get_prefecture_from_url(url)
+                if not self._claim_station_key(station_key):
+                    continue
 
-                # Determine railway company from line name
-                railway_company = self._get_company_from_line(line_name)
+                stations_found.add(station_name)
 
                 # Try to get additional details by visiting station page
                 station_details = self._get_station_details(station_href)
@@ -772,14 +1803,14 @@ class StationCrawler:
                     name_romaji=text_variants.get("romaji"),
                     prefecture=station_prefecture,
                     prefecture_id=prefecture_id,
-                    station_id=station_details.station_id,
+                    station_id=station_details.station_id or station_id,
                     railway_company=railway_company,
                     line_name=line_name,
                     aliases=station_details.aliases or [],
                     all_lines=station_details.all_lines or [],
                 )
 
-                self.stations.append(station)
+                self._collect_stations((station,))
 
             logger.info(f"Found {len(stations_found)} stations on {line_name}")
 
@@ -801,121 +1832,172 @@ class StationCrawler:
         Returns:
             List of Station objects found on this line
         """
-        line_stations = []
-
         try:
+            self.rate_limiter.acquire()
             response = self.session.get(url, timeout=self.timeout)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Look for station links - Yahoo uses pattern /station/{id}?pref={pref}&company={company}&line={line}
-            station_links = []
-            stations_found = []
-
-            for link in soup.find_all("a", href=True):
-                href = str(link.get("href", ""))
-                text = link.get_text().strip()
-
-                # Look for station links with query parameters
-                if (
-                    "/station/" in href
-                    and "pref=" in href
-                    and "company=" in href
-                    and text
-                ):
-                    # Filter out non-station links
-                    if text not in ["駅情報", "時刻表"] and len(text) <= 15:
-                        station_links.append((text, href))
-
-            # Extract detailed station information
-            for _station_idx, (station_name, station_href) in enumerate(
-                station_links, 1
-            ):
-                if station_name in stations_found:
-                    continue  # Skip duplicates
+            station_prefecture, new_links = self._claim_new_station_links(
+                response.content, url, prefecture
+            )
 
-                # Extract station ID from href for deduplication
-                import re
+            # Fetch station pages concurrently; the rate limiter keeps the
+            # overall request rate polite
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                all_details = list(
+                    executor.map(
+                        self._get_station_details,
+                        [station_href for _, station_href, _ in new_links],
+                    )
+                )
 
-                station_id = None
-                if "/station/" in station_href:
-                    station_id_match = re.search(r"/station/(\d+)", station_href)
-                    if station_id_match:
-                        station_id = station_id_match.group(1)
+            return self._build_line_stations(
+                new_links, all_details, line_name, station_prefecture
+            )
 
-                # Check if this station already exists (use station_id if available, otherwise name+prefecture)
-                if station_id:
-                    station_key = station_id
-                else:
-                    station_key = f"{station_name}_{prefecture}"
+        except requests.RequestException as e:
+            raise NetworkError(f"Failed to fetch Yahoo Transit page: {e}") from e
+        except Exception as e:
+            raise ScrapingError(f"Failed to parse Yahoo Transit page: {e}") from e
 
-                if station_key in self.existing_stations:
-                    self.progress.duplicates_filtered += 1
-                    logger.debug(
-                        f"Skipping duplicate station: {station_name} (ID: {station_id or 'None'}) ({prefecture})"
-                    )
-                    continue
+    def _claim_new_station_links(
+        self, content: bytes, url: str, prefecture: str | None
+    ) -> tuple[str, list[tuple[str, str, str | None]]]:
+        """Find a line page's station links and claim the ones not seen yet.
 
-                # Add to existing stations set for future duplicate checking
-                self.existing_stations.add(station_key)
+        Args:
+            content: Raw line page HTML
+            url: Yahoo Transit line page URL
+            prefecture: Prefecture name, if known
 
-                stations_found.append(station_name)
+        Returns:
+            Resolved prefecture and (name, href, station ID) tuples for the new
+            stations, in page order
+        """
+        # Look for station links - Yahoo uses pattern /station/{id}?pref={pref}&company={company}&line={line}
+        station_links = []
+        stations_found: set[str] = set()
+
+        # Look for station links with query parameters
+        for href, text in _extract_anchors(content, _STATION_LINK_PARTS):
+            # Filter out non-station links
+            if text and text not in ["駅情報", "時刻表"] and len(text) <= 15:
+                station_links.append((text, href))
+
+        # Get prefecture from URL or parameter. Resolve it before the dedup
+        # check so keys match the prefecture written to the CSV.
+        station_prefecture = prefecture or self._get_prefecture_from_url(url)
+
+        # Filter out duplicates before fetching any station pages
+        new_links: list[tuple[str, str, str | None]] = []
+        for station_name, station_href in station_links:
+            if station_name in stations_found:
+                continue  # Skip duplicates
+
+            # Extract station ID from href for deduplication
+            station_id_match = _STATION_ID_RE.search(station_href)
+            station_id = station_id_match.group(1) if station_id_match else None
+
+            # Check if this station already exists (use station_id if available, otherwise name+prefecture)
+            station_key = _station_key(station_id, station_name, station_prefecture)
+
+            if not self._claim_station_key(station_key):
+                logger.debug(
+                    f"Skipping duplicate station: {station_name} (ID: {station_id or 'None'}) ({station_prefecture})"
+                )
+                continue
 
-                # Extract additional info from URL parameters
-                self._extract_station_info_from_url(station_href, url)
+            stations_found.add(station_name)
+            new_links.append((station_name, station_href, station_id))
 
-                # Get prefecture from URL or parameter
-                station_prefecture = prefecture or self._get_prefecture_from_url(url)
+        return station_prefecture, new_links
 
-                # Determine railway company from line name
-                railway_company = self._get_company_from_line(line_name)
+    def _build_line_stations(
+        self,
+        new_links: list[tuple[str, str, str | None]],
+        all_details: list[StationDetails],
+        line_name: str,
+        station_prefecture: str,
+    ) -> list[Station]:
+        """Build Station objects for a line's new stations.
 
-                # Try to get additional details by visiting station page
-                station_details = self._get_station_details(station_href)
+        Args:
+            new_links: (name, href, station ID) tuples of the new stations
+            all_details: Station page details, one per link
+            line_name: Railway line name
+            station_prefecture: Prefecture name
 
-                # Create station with comprehensive line information
-                # Ensure prefecture_id is set if not in station_details
-                prefecture_id = station_details.prefecture_id
-                if not prefecture_id and station_prefecture:
-                    prefecture_id = PREFECTURE_ID_MAPPING.get(station_prefecture)
+        Returns:
+            List of Station objects in page order
+        """
+        line_stations = []
 
-                # Use station_id extracted from href if station_details doesn't have it
-                final_station_id = station_details.station_id or station_id
+        # Determine railway company from line name
+        railway_company = self._get_company_from_line(line_name)
+
+        # Line names recur across the whole crawl; share one copy of each
+        intern = sys.intern
+        line_name = intern(line_name)
+
+        for (station_name, _station_href, station_id), station_details in zip(
+            new_links, all_details, strict=True
+        ):
+            # Create station with comprehensive line information
+            # Ensure prefecture_id is set if not in station_details
+            prefecture_id = station_details.prefecture_id
+            if not prefecture_id and station_prefecture:
+                prefecture_id = PREFECTURE_ID_MAPPING.get(station_prefecture)
+
+            # Use station_id extracted from href if station_details doesn't have it
+            final_station_id = station_details.station_id or station_id
+
+            # Generate Japanese text variants
+            text_variants = generate_text_variants(station_name)
+
+            station = Station(
+                name=station_name,
+                name_hiragana=text_variants.get("hiragana"),
+                name_katakana=text_variants.get("katakana"),
+                name_romaji=text_variants.get("romaji"),
+                prefecture=station_prefecture,
+                prefecture_id=prefecture_id,
+                station_id=final_station_id,
+                railway_company=railway_company,
+                line_name=line_name,
+                aliases=station_details.aliases or [],
+                all_lines=[intern(line) for line in station_details.all_lines or []],
+            )
 
-                # Generate Japanese text variants
-                text_variants = generate_text_variants(station_name)
+            line_stations.append(station)
 
-                station = Station(
-                    name=station_name,
-                    name_hiragana=text_variants.get("hiragana"),
-                    name_katakana=text_variants.get("katakana"),
-                    name_romaji=text_variants.get("romaji"),
-                    prefecture=station_prefecture,
-                    prefecture_id=prefecture_id,
-                    station_id=final_station_id,
-                    railway_company=railway_company,
-                    line_name=line_name,
-                    aliases=station_details.aliases or [],
-                    all_lines=station_details.all_lines or [],
-                )
+            # Update progress with this newly processed station
+            self._update_progress(
+                f"Found station: {station_name}",
+                increment_stations=1,
+                station_name=station_name,
+            )
 
-                line_stations.append(station)
+        logger.info(f"Found {len(line_stations)} stations on {line_name}")
+        return line_stations
 
-                # Update progress with this newly processed station
-                self._update_progress(
-                    f"Found station: {station_name}",
-                    increment_stations=1,
-                    station_name=station_name,
-                )
+    def _claim_station_key(self, station_key: int) -> bool:
+        """Record a station key, reporting whether it was new.
 
-            logger.info(f"Found {len(stations_found)} stations on {line_name}")
-            return line_stations
+        Args:
+            station_key: Key from ``_station_key``
 
-        except requests.RequestException as e:
-            raise NetworkError(f"Failed to fetch Yahoo Transit page: {e}") from e
-        except Exception as e:
-            raise ScrapingError(f"Failed to parse Yahoo Transit page: {e}") from e
+        Returns:
+            True if the station had not been seen before, False for duplicates
+        """
+        # A single add plus a length check hashes the key once, where a
+        # membership test followed by add would hash it twice
+        with self._lock:
+            seen_count = len(self.existing_stations)
+            self.existing_stations.add(station_key)
+            if len(self.existing_stations) == seen_count:
+                self.progress.duplicates_filtered += 1
+                return False
+            return True
 
     def _extract_station_info_from_url(
         self, station_href: str, line_url: str
@@ -929,16 +2011,8 @@ class StationCrawler:
         Returns:
             Dictionary with extracted information
         """
-        from urllib.parse import parse_qs, urlparse
-
-        parsed = urlparse(station_href)
-        params = parse_qs(parsed.query)
-
-        return {
-            "pref": params.get("pref", [""])[0],
-            "company": params.get("company", [""])[0],
-            "line": params.get("line", [""])[0],
-        }
+        pref, company, line = _parse_station_href(station_href)
+        return {"pref": pref, "company": company, "line": line}
 
     def _get_station_details(self, station_href: str) -> StationDetails:
         """Get detailed station information from station page.
@@ -949,156 +2023,181 @@ class StationCrawler:
         Returns:
             Dictionary with station details
         """
+        if self.details_cache:
+            cached = self.details_cache.get(station_href)
+            if cached is not None:
+                return cached
+
         details = StationDetails()
 
         try:
-            # Extract prefecture from URL and map to prefecture ID
-            prefecture_name = self._get_prefecture_from_url(station_href)
-            details.prefecture_id = PREFECTURE_ID_MAPPING.get(prefecture_name)
-
-            # Also try to extract from URL parameters if available
-            if "?" in station_href:
-                from urllib.parse import parse_qs, unquote, urlparse
-
-                parsed_url = urlparse(station_href)
-                params = parse_qs(parsed_url.query)
-
-                if "pref" in params and params["pref"][0]:
-                    # The pref parameter might contain prefecture code
-                    pref_code = params["pref"][0]
-                    # Find prefecture name by code
-                    for _pref_name, code in PREFECTURE_ID_MAPPING.items():
-                        if code == pref_code.zfill(2):  # Ensure 2-digit format
-                            details.prefecture_id = code
-                            break
-            # Make full URL
-            if station_href.startswith("/"):
-                station_url = f"https://transit.yahoo.co.jp{station_href}"
-            else:
-                station_url = station_href
+            station_url, details, link_info = self._station_url_and_details(
+                station_href
+            )
 
-            response = self.session.get(station_url, timeout=self.timeout)
+            self.rate_limiter.acquire()
+            # Stream so the body is only downloaded for pages we parse
+            response = self.session.get(station_url, timeout=self.timeout, stream=True)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.text, "html.parser")
-
-                # Extract station name with prefecture disambiguation
-                title_elem = soup.find("title")
-                if title_elem:
-                    title_text = title_elem.get_text()
-                    # Extract station name from title like "青山(岩手県)駅の駅周辺情報"
-                    import re
-
-                    station_match = re.search(r"(.+?)駅の", title_text)
-                    if station_match:
-                        station_name_with_pref = station_match.group(1)
-                        if "(" in station_name_with_pref:
-                            if details.aliases is None:
-                                details.aliases = []
-                            details.aliases.append(station_name_with_pref)
-
-                # Extract all lines serving this station
-                # Look for both link elements and dt elements (which contain line names)
-                line_elements = soup.find_all("a", href=True) + soup.find_all("dt")
-                lines_found = set()
-                for elem in line_elements:
-                    text = elem.get_text().strip()
-
-                    # Look for line links or line names (including 市電, 電車, etc.)
-                    if (
-                        "線" in text
-                        or "Line" in text
-                        or "市電" in text
-                        or "電車" in text
-                    ) and len(text) < 30:
-                        # Filter out common non-line texts
-                        exclude_terms = ["路線図", "路線情報", "線路", "新幹線情報"]
-                        if (
-                            not any(term in text for term in exclude_terms)
-                            and text not in lines_found
-                        ):
-                            lines_found.add(text)
-
-                details.all_lines = list(lines_found)
-
-                # Extract station ID from URL
-                import re
-
-                station_id_match = re.search(r"/station/(\d+)", station_url)
-                if station_id_match:
-                    details.station_id = station_id_match.group(1)
-
-                # Extract station reading (kana) from HTML
-                station_kana_elem = soup.find("span", class_="staKana")
-                if station_kana_elem:
-                    details.station_reading = station_kana_elem.get_text().strip()
-
-                # Extract company and line info from JSON data structure
-                script_tags = soup.find_all("script", type="application/json")
-                for script in script_tags:
-                    try:
-                        json_data = json.loads(script.string or "")
-                        # Look for Next.js data structure
-                        if "props" in json_data and "pageProps" in json_data["props"]:
-                            page_props = json_data["props"]["pageProps"]
-
-                            # Try multiple JSON paths for company/line info
-
-                            # Path 1: Traditional station data structure
-                            if "station" in page_props:
-                                station_data = page_props["station"]
-                                if "company" in station_data:
-                                    details.company_name = station_data["company"]
-                                if "line" in station_data:
-                                    details.line_name = station_data["line"]
-
-                            # Path 2: lipFeature.TransitSearchInfo.Detail structure (more common)
-                            if not details.company_name and "lipFeature" in page_props:
-                                lip_feature = page_props["lipFeature"]
-                                if "TransitSearchInfo" in lip_feature:
-                                    transit_info = lip_feature["TransitSearchInfo"]
-                                    if "Detail" in transit_info:
-                                        detail = transit_info["Detail"]
-                                        if "CompanyName" in detail:
-                                            details.company_name = detail["CompanyName"]
-                                        if "RailName" in detail:
-                                            details.line_name = detail["RailName"]
-
-                    except (json.JSONDecodeError, KeyError):
-                        continue
+                self._parse_station_page(
+                    details, station_url, response.content, link_info
+                )
+                if self.details_cache:
+                    self.details_cache.put(station_href, details)
+            else:
+                # Release the connection without reading the error body
+                response.close()
 
-                # Also try to extract from URL parameters which contain company and line info
-                if "?" in station_url:
-                    from urllib.parse import parse_qs, urlparse
+        except Exception as e:
+            logger.debug(f"Failed to get station details: {e}")
 
-                    parsed_url = urlparse(station_url)
-                    params = parse_qs(parsed_url.query)
+        return details
 
-                    if "company" in params:
-                        # URL decode the company name
-                        from urllib.parse import unquote
+    def _station_url_and_details(
+        self, station_href: str
+    ) -> tuple[str, StationDetails, dict[str, str]]:
+        """Resolve a station link to its page URL and the details it implies.
 
-                        details.company_name = unquote(params["company"][0])
+        The link's query string is parsed once here; the page parser reuses
+        the result instead of parsing the URL again.
 
-                    if "line" in params:
-                        # URL decode the line name
-                        from urllib.parse import unquote
+        Args:
+            station_href: Station page href
 
-                        details.line_name = unquote(params["line"][0])
+        Returns:
+            Absolute station page URL, details holding the prefecture ID, and
+            the link's pref/company/line parameters
+        """
+        details = StationDetails()
 
-                # City extraction removed - Yahoo Transit pages don't contain reliable city/ward data
-                # Based on comprehensive analysis, no city information is extractable from page text
+        # Extract prefecture from URL and map to prefecture ID
+        prefecture_name = self._get_prefecture_from_url(station_href)
+        details.prefecture_id = PREFECTURE_ID_MAPPING.get(prefecture_name)
 
-                # Station codes, coordinates, and line colors removed - fields deleted from Station model
+        # Make full URL
+        if station_href.startswith("/"):
+            station_url = f"{YAHOO_TRANSIT_BASE_URL}{station_href}"
+        else:
+            station_url = station_href
 
-            # Add small delay to be respectful
-            import time
+        # Also try to extract from URL parameters if available
+        link_info = self._extract_station_info_from_url(station_href, station_url)
+        if link_info["pref"]:
+            # The pref parameter might contain prefecture code
+            pref_code = link_info["pref"].zfill(2)  # Ensure 2-digit format
+            if pref_code in _PREFECTURE_NAME_BY_ID:
+                details.prefecture_id = pref_code
 
-            time.sleep(0.5)
+        return station_url, details, link_info
 
-        except Exception as e:
-            logger.debug(f"Failed to get station details: {e}")
+    def _parse_station_page(
+        self,
+        details: StationDetails,
+        station_url: str,
+        content: bytes,
+        link_info: dict[str, str],
+    ) -> None:
+        """Fill in station details from a station page.
 
-        return details
+        Args:
+            details: Details to update in place
+            station_url: Station page URL
+            content: Raw station page HTML
+            link_info: The station link's pref/company/line parameters
+        """
+        # Raw bytes go straight to the parser, skipping a str decode
+        page = _read_station_page(content)
+
+        # Extract station name with prefecture disambiguation
+        if page.title:
+            title_text = page.title
+            # Extract station name from title like "青山(岩手県)駅の駅周辺情報"
+            station_match = _TITLE_STATION_RE.search(title_text)
+            if station_match:
+                station_name_with_pref = station_match.group(1)
+                if "(" in station_name_with_pref:
+                    if details.aliases is None:
+                        details.aliases = []
+                    details.aliases.append(station_name_with_pref)
+
+        # Extract station ID from URL
+        station_id_match = _STATION_ID_RE.search(station_url)
+        if station_id_match:
+            details.station_id = station_id_match.group(1)
+
+        # Extract station reading (kana) from HTML
+        if page.kana is not None:
+            details.station_reading = page.kana.strip()
+
+        # Extract company and line info from the Next.js JSON payload
+        rail_names: list[str] = []
+        if page.next_data is not None:
+            try:
+                json_data = json_loads(page.next_data)
+                # Look for Next.js data structure
+                if "props" in json_data and "pageProps" in json_data["props"]:
+                    page_props = json_data["props"]["pageProps"]
+
+                    # Try multiple JSON paths for company/line info
+
+                    # Path 1: Traditional station data structure
+                    if "station" in page_props:
+                        station_data = page_props["station"]
+                        if "company" in station_data:
+                            details.company_name = station_data["company"]
+                        if "line" in station_data:
+                            details.line_name = station_data["line"]
+
+                    # Path 2: lipFeature.TransitSearchInfo.Detail structure (more common)
+                    if "lipFeature" in page_props:
+                        lip_feature = page_props["lipFeature"]
+                        if "TransitSearchInfo" in lip_feature:
+                            transit_info = lip_feature["TransitSearchInfo"]
+                            if "Detail" in transit_info:
+                                detail = transit_info["Detail"]
+                                if not details.company_name:
+                                    if "CompanyName" in detail:
+                                        details.company_name = detail["CompanyName"]
+                                    if "RailName" in detail:
+                                        details.line_name = detail["RailName"]
+                                rail_names = _rail_names_from_detail(detail)
+
+            except (json.JSONDecodeError, KeyError):
+                pass
+
+        # Extract all lines serving this station. The JSON rail groups
+        # list them directly; only fall back to scanning the page when
+        # they are missing.
+        if rail_names:
+            details.all_lines = list(dict.fromkeys(rail_names))
+        else:
+            # Look for both link elements and dt elements (which contain line
+            # names), within the station's rail section when the page has one
+            # Keep line links and line names (including 市電, 電車, etc.),
+            # filtering out common non-line texts
+            lines_found = {
+                text
+                for text in map(str.strip, page.rail_texts)
+                if len(text) < 30
+                and ("線" in text or "Line" in text or "市電" in text or "電車" in text)
+                and not _NON_LINE_TEXT_RE.search(text)
+            }
+
+            details.all_lines = list(lines_found)
+
+        # Also use the URL parameters, which contain company and line info
+        if link_info["company"]:
+            # URL decode the company name
+            details.company_name = unquote(link_info["company"])
+
+        if link_info["line"]:
+            # URL decode the line name
+            details.line_name = unquote(link_info["line"])
+
+        # City extraction removed - Yahoo Transit pages don't contain reliable city/ward data
+        # Based on comprehensive analysis, no city information is extractable from page text
+
+        # Station codes, coordinates, and line colors removed - fields deleted from Station model
 
     def _get_prefecture_from_url(self, url: str) -> str:
         """Extract prefecture from Yahoo Transit URL.
@@ -1110,72 +2209,20 @@ class StationCrawler:
             Prefecture name
         """
         # Yahoo uses prefecture codes: 1=Hokkaido, 13=Tokyo, 14=Kanagawa, etc.
-        # Support both padded (/01/) and unpadded (/1/) formats
-        prefecture_map = {}
-
-        # Create mapping for both padded and unpadded codes
-        code_to_name = {
-            "1": "北海道",
-            "2": "青森県",
-            "3": "岩手県",
-            "4": "宮城県",
-            "5": "秋田県",
-            "6": "山形県",
-            "7": "福島県",
-            "8": "茨城県",
-            "9": "栃木県",
-            "10": "群馬県",
-            "11": "埼玉県",
-            "12": "千葉県",
-            "13": "東京都",
-            "14": "神奈川県",
-            "15": "新潟県",
-            "16": "富山県",
-            "17": "石川県",
-            "18": "福井県",
-            "19": "山梨県",
-            "20": "長野県",
-            "21": "岐阜県",
-            "22": "静岡県",
-            "23": "愛知県",
-            "24": "三重県",
-            "25": "滋賀県",
-            "26": "京都府",
-            "27": "大阪府",
-            "28": "兵庫県",
-            "29": "奈良県",
-            "30": "和歌山県",
-            "31": "鳥取県",
-            "32": "島根県",
-            "33": "岡山県",
-            "34": "広島県",
-            "35": "山口県",
-            "36": "徳島県",
-            "37": "香川県",
-            "38": "愛媛県",
-            "39": "高知県",
-            "40": "福岡県",
-            "41": "佐賀県",
-            "42": "長崎県",
-            "43": "熊本県",
-            "44": "大分県",
-            "45": "宮崎県",
-            "46": "鹿児島県",
-            "47": "沖縄県",
-        }
-
-        # Add both formats to the map
-        for code, name in code_to_name.items():
-            prefecture_map[f"/{code}/"] = name
-            prefecture_map[f"/{code.zfill(2)}/"] = name  # Also support zero-padded
-
-        for code, prefecture in prefecture_map.items():
-            if code in url:
-                return prefecture
+        # When several segments are known codes, the lowest code wins
+        codes = [
+            code
+            for match in _PREF_URL_RE.finditer(url)
+            if (code := match.group(1).zfill(2)) in _PREFECTURE_NAME_BY_ID
+        ]
+        if codes:
+            return _PREFECTURE_NAME_BY_ID[min(codes)]
 
         return "東京都"  # Default to Tokyo
 
-    def _get_company_from_line(self, line_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _get_company_from_line(line_name: str) -> str:
         """Extract railway company from line name.
 
         Args:
@@ -1184,35 +2231,21 @@ class StationCrawler:
         Returns:
             Railway company name
         """
-        if "JR" in line_name:
-            return "JR東日本"
-        elif "東京メトロ" in line_name:
-            return "東京メトロ"
-        elif "都営" in line_name:
-            return "都営地下鉄"
-        elif "小田急" in line_name:
-            return "小田急電鉄"
-        elif "京急" in line_name:
-            return "京浜急行電鉄"
-        else:
-            return "その他"
+        for marker, company in _LINE_COMPANY_RULES:
+            if marker in line_name:
+                return company
+        return "その他"
 
     def _deduplicate_stations(self) -> list[Station]:
-        """Remove duplicate stations based on name and prefecture.
+        """Get the crawled stations, unique by name and prefecture.
+
+        ``_collect_stations`` drops repeats as stations are added, so no
+        second pass over the list is needed.
 
         Returns:
             List of unique stations
         """
-        seen: set[tuple[str, str | None]] = set()
-        unique_stations = []
-
-        for station in self.stations:
-            key = (station.name, station.prefecture)
-            if key not in seen:
-                seen.add(key)
-                unique_stations.append(station)
-
-        return unique_stations
+        return self.stations
 
 
 class StationSearcher:
@@ -1229,53 +2262,71 @@ class StationSearcher:
 
         # Import fuzzy search dependencies
         try:
-            from fuzzywuzzy import fuzz, process  # type: ignore[import-untyped]
+            from rapidfuzz import fuzz, process, utils
 
             self._fuzz = fuzz
             self._process = process
+            self._fuzz_processor = utils.default_process
+            # _all_terms run through the processor once, so queries only
+            # need to process the query string
+            self._fuzzy_choices = [
+                utils.default_process(term) for term in self._all_terms
+            ]
             self._fuzzy_available = True
         except ImportError:
             self._fuzzy_available = False
 
     def _build_search_index(self) -> None:
         """Build search index for faster lookups with Japanese text variants."""
-        self.name_index: dict[str, list[Station]] = {}
-        self.hiragana_index: dict[str, list[Station]] = {}
-        self.katakana_index: dict[str, list[Station]] = {}
-        self.romaji_index: dict[str, list[Station]] = {}
-        self.prefecture_index: dict[str, list[Station]] = {}
+        # Filled as defaultdicts, then frozen into plain dicts at the end
+        name_index: defaultdict[str, list[Station]] = defaultdict(list)
+        hiragana_index: defaultdict[str, list[Station]] = defaultdict(list)
+        katakana_index: defaultdict[str, list[Station]] = defaultdict(list)
+        romaji_index: defaultdict[str, list[Station]] = defaultdict(list)
+        prefecture_index: defaultdict[str, list[Station]] = defaultdict(list)
 
         # Build comprehensive search terms for each station (use index as key)
         self.search_terms: dict[int, list[str]] = {}
+        # Lowercased copies of search_terms, computed once for matching
+        self.search_terms_lower: dict[int, list[str]] = {}
+
+        # Lowercased term -> (station index, term is an alias) for exact lookups
+        self._exact_lower: dict[str, list[tuple[int, bool]]] = {}
+        # Lowercased n-gram (1..SEARCH_NGRAM_SIZE chars) -> ascending station indices
+        self._ngram_index: dict[str, list[int]] = {}
+        # Flat list of every search term (with repeats) for fuzzy matching,
+        # and each distinct term's station indices
+        self._all_terms: list[str] = []
+        self._term_to_station_indices: dict[str, list[int]] = {}
+        # Station index -> small int shared by stations with the same identity
+        # (station_id, or name+line+company when there is no ID)
+        self._unique_ids: list[int] = []
+        unique_key_ids: dict[str, int] = {}
+        # Line name -> lowercased line name, for list_stations line filters
+        self._line_names_lower: dict[str, str] = {}
+        # Line name -> indices of its stations, in station order
+        self._line_station_indices: dict[str, list[int]] = {}
 
         for i, station in enumerate(self.stations):
             # Index by original name
-            if station.name not in self.name_index:
-                self.name_index[station.name] = []
-            self.name_index[station.name].append(station)
+            name_index[station.name].append(station)
 
             # Build comprehensive search terms list
             search_terms = [station.name]
 
             # Index by hiragana name
             if station.name_hiragana:
-                if station.name_hiragana not in self.hiragana_index:
-                    self.hiragana_index[station.name_hiragana] = []
-                self.hiragana_index[station.name_hiragana].append(station)
+                hiragana_index[station.name_hiragana].append(station)
                 search_terms.append(station.name_hiragana)
 
             # Index by katakana name
             if station.name_katakana:
-                if station.name_katakana not in self.katakana_index:
-                    self.katakana_index[station.name_katakana] = []
-                self.katakana_index[station.name_katakana].append(station)
+                katakana_index[station.name_katakana].append(station)
                 search_terms.append(station.name_katakana)
 
             # Index by romaji name
             if station.name_romaji:
-                if station.name_romaji not in self.romaji_index:
-                    self.romaji_index[station.name_romaji] = []
-                self.romaji_index[station.name_romaji].append(station)
+                romaji_index[station.name_romaji].append(station)
                 search_terms.append(station.name_romaji)
 
             # Add aliases to search terms
@@ -1284,12 +2335,105 @@ class StationSearcher:
 
             # Store all search terms for this station (use index as key)
             self.search_terms[i] = search_terms
+            self._all_terms.extend(search_terms)
+            for term in search_terms:
+                self._term_to_station_indices.setdefault(term, []).append(i)
+
+            # Create unique identifier from station_id or fallback to name+line combination
+            unique_key = (
+                station.station_id
+                if station.station_id
+                else f"{station.name}|{station.line_name}|{station.railway_company}"
+            )
+            self._unique_ids.append(
+                unique_key_ids.setdefault(unique_key, len(unique_key_ids))
+            )
+
+            # Index lowercased terms for exact and substring lookups
+            aliases = station.aliases or []
+            ngrams: set[str] = set()
+            terms_lower = [term.lower() for term in search_terms]
+            self.search_terms_lower[i] = terms_lower
+            for term, term_lower in zip(search_terms, terms_lower, strict=True):
+                self._exact_lower.setdefault(term_lower, []).append(
+                    (i, term in aliases)
+                )
+                for size in range(1, SEARCH_NGRAM_SIZE + 1):
+                    for start in range(len(term_lower) - size + 1):
+                        ngrams.add(term_lower[start : start + size])
+            for ngram in ngrams:
+                self._ngram_index.setdefault(ngram, []).append(i)
 
             # Index by prefecture
             if station.prefecture:
-                if station.prefecture not in self.prefecture_index:
-                    self.prefecture_index[station.prefecture] = []
-                self.prefecture_index[station.prefecture].append(station)
+                prefecture_index[station.prefecture].append(station)
+
+            if station.line_name:
+                if station.line_name not in self._line_names_lower:
+                    self._line_names_lower[station.line_name] = (
+                        station.line_name.lower()
+                    )
+                    self._line_station_indices[station.line_name] = []
+                self._line_station_indices[station.line_name].append(i)
+
+        self.name_index: dict[str, list[Station]] = dict(name_index)
+        self.hiragana_index: dict[str, list[Station]] = dict(hiragana_index)
+        self.katakana_index: dict[str, list[Station]] = dict(katakana_index)
+        self.romaji_index: dict[str, list[Station]] = dict(romaji_index)
+        self.prefecture_index: dict[str, list[Station]] = dict(prefecture_index)
+
+    def _fuzzy_extract(
+        self, query: str, limit: int, threshold: int
+    ) -> list[tuple[str, int]]:
+        """Find the best fuzzy matches for a query among all search terms.
+
+        Args:
+            query: Search query
+            limit: Maximum number of matches
+            threshold: Minimum match score (0-100)
+
+        Returns:
+            List of (term, score) tuples sorted by score, scores rounded to ints
+        """
+        # Scores are rounded below, so let anything that rounds up to the
+        # threshold through the C-level cutoff
+        matches = self._process.extract(
+            self._fuzz_processor(query),
+            self._fuzzy_choices,
+            scorer=self._fuzz.ratio,
+            processor=None,
+            limit=limit,
+            score_cutoff=max(threshold - 0.5, 0),
+        )
+        return [
+            (self._all_terms[index], rounded)
+            for _choice, score, index in matches
+            if (rounded := round(score)) >= threshold
+        ]
+
+    def _substring_candidates(self, query_lower: str) -> set[int] | range:
+        """Get indices of stations that may contain the query as a substring.
+
+        Args:
+            query_lower: Lowercased search query
+
+        Returns:
+            Candidate station indices; every true match is included, but
+            candidates still need to be verified against their terms
+        """
+        if not query_lower:
+            return range(len(self.stations))
+
+        size = min(len(query_lower), SEARCH_NGRAM_SIZE)
+        postings = []
+        for start in range(len(query_lower) - size + 1):
+            posting = self._ngram_index.get(query_lower[start : start + size])
+            if posting is None:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        return set(postings[0]).intersection(*postings[1:])
 
     def search_by_name(
         self, query: str, exact: bool = False, fuzzy_threshold: int = 70
@@ -1331,92 +2475,43 @@ class StationSearcher:
         results = []
         query_lower = query.lower()
 
-        # First pass: collect exact alias matches and all other matches separately
-        exact_alias_matches = []
-        all_other_matches = []
-
-        for i, station in enumerate(self.stations):
-            has_exact_alias = False
-            best_other_score = 0
-
-            # Check all search terms for this station using index
-            search_terms = self.search_terms[i]
-
-            # Check main station fields (name, hiragana, katakana, romaji)
-            main_terms = [
-                station.name,
-                station.name_hiragana,
-                station.name_katakana,
-                station.name_romaji,
-            ]
-            main_terms = [t for t in main_terms if t]  # Remove None values
-
-            # Check aliases
-            aliases = station.aliases if station.aliases else []
-
-            for term in search_terms:
-                term_lower = term.lower()
-                if query_lower == term_lower:
-                    if term in aliases:
-                        has_exact_alias = True
-                        break  # Found exact alias match
-                    else:
-                        best_other_score = max(
-                            best_other_score, 100
-                        )  # Exact match on main field
-                elif query_lower in term_lower:
-                    best_other_score = max(best_other_score, 90)  # Substring match
-
-            if has_exact_alias:
-                exact_alias_matches.append((station, 100))
-            elif best_other_score > 0:
-                all_other_matches.append((station, best_other_score))
+        # First pass: exact matches on any search term via the lowercase index
+        exact_hits = self._exact_lower.get(query_lower, [])
+        alias_indices = {i for i, is_alias in exact_hits if is_alias}
 
         # If we have exact alias matches, return only those
         # Otherwise return all other matches (exact name matches + substring matches)
-        results_with_scores = []
-        if exact_alias_matches:
-            results_with_scores = exact_alias_matches
+        results_with_scores: list[tuple[int, int]] = []
+        if alias_indices:
+            results_with_scores = [(i, 100) for i in sorted(alias_indices)]
         else:
-            results_with_scores = all_other_matches
+            best_scores = {i: 100 for i, _is_alias in exact_hits}
+
+            # Second pass: substring matches among n-gram index candidates
+            for i in self._substring_candidates(query_lower):
+                if i not in best_scores and any(
+                    query_lower in term_lower
+                    for term_lower in self.search_terms_lower[i]
+                ):
+                    best_scores[i] = 90
+
+            results_with_scores = [(i, best_scores[i]) for i in sorted(best_scores)]
 
         # Third pass: fuzzy matching if available and no matches found
         if not results_with_scores and self._fuzzy_available:
-            # Create a flat list of all search terms with their stations
-            all_terms = []
-            term_to_stations: dict[str, list[Station]] = {}
-
-            for i, station in enumerate(self.stations):
-                for term in self.search_terms[i]:
-                    all_terms.append(term)
-                    if term not in term_to_stations:
-                        term_to_stations[term] = []
-                    term_to_stations[term].append(station)
-
-            # Use fuzzywuzzy to find best matches
-            fuzzy_matches = self._process.extract(
-                query, all_terms, limit=20, scorer=self._fuzz.ratio
-            )
-
-            for match in fuzzy_matches:
-                term, score = match[0], match[1]
-                if score >= fuzzy_threshold:
-                    for station in term_to_stations[term]:
-                        results_with_scores.append((station, score))
+            # Use rapidfuzz to find best matches
+            for term, score in self._fuzzy_extract(query, 20, fuzzy_threshold):
+                for i in self._term_to_station_indices[term]:
+                    results_with_scores.append((i, score))
 
         # Remove duplicates and sort by score using station identifiers
-        seen_scored_stations: set[str] = set()
+        seen_scored_stations: set[int] = set()
         scored_results: list[tuple[Station, int]] = []
-        for station, score in results_with_scores:
-            # Create unique identifier from station_id or fallback to name+line combination
-            unique_key = (
-                station.station_id
-                if station.station_id
-                else f"{station.name}|{station.line_name}|{station.railway_company}"
-            )
-            if unique_key not in seen_scored_stations:
-                scored_results.append((station, score))
-                seen_scored_stations.add(unique_key)
+        for i, score in results_with_scores:
+            unique_id = self._unique_ids[i]
+            if unique_id not in seen_scored_stations:
+                scored_results.append((self.stations[i], score))
+                seen_scored_stations.add(unique_id)
 
         # Sort by score (highest first) then by name
         scored_results.sort(key=lambda x: (-x[1], x[0].name))
@@ -1478,39 +2573,16 @@ class StationSearcher:
             stations = self.search_by_name(query, exact=False)
             return [(station, 100) for station in stations[:limit]]
 
-        # Create comprehensive search terms list
-        all_terms = []
-        term_to_stations: dict[str, list[Station]] = {}
-
-        for i, station in enumerate(self.stations):
-            for term in self.search_terms[i]:
-                all_terms.append(term)
-                if term not in term_to_stations:
-                    term_to_stations[term] = []
-                term_to_stations[term].append(station)
-
-        # Get fuzzy matches
-        fuzzy_matches = self._process.extract(
-            query, all_terms, limit=limit * 3, scorer=self._fuzz.ratio
-        )
-
         # Build results with scores
         results: list[tuple[Station, int]] = []
-        seen: set[str] = set()
-
-        for match in fuzzy_matches:
-            term, score = match[0], match[1]
-            if score >= threshold:
-                for station in term_to_stations[term]:
-                    # Create unique identifier from station_id or fallback to name+line combination
-                    unique_key = (
-                        station.station_id
-                        if station.station_id
-                        else f"{station.name}|{station.line_name}|{station.railway_company}"
-                    )
-                    if unique_key not in seen:
-                        results.append((station, score))
-                        seen.add(unique_key)
+        seen: set[int] = set()
+
+        for term, score in self._fuzzy_extract(query, limit * 3, threshold):
+            for i in self._term_to_station_indices[term]:
+                unique_id = self._unique_ids[i]
+                if unique_id not in seen:
+                    results.append((self.stations[i], score))
+                    seen.add(unique_id)
 
         # Sort by score and limit results
         results.sort(key=lambda x: -x[1])
@@ -1544,18 +2616,26 @@ class StationSearcher:
         Returns:
             List of matching stations
         """
-        stations = self.stations
+        if not line:
+            stations = (
+                self.prefecture_index.get(prefecture, [])
+                if prefecture
+                else self.stations
+            )
+            return stations[:limit]
+
+        # Match the query against distinct line names, then merge the
+        # per-line station indices back into station order
+        line_lower = line.lower()
+        matched_lines = [
+            self._line_station_indices[name]
+            for name, name_lower in self._line_names_lower.items()
+            if line_lower in name_lower
+        ]
+        stations = [self.stations[i] for i in heapq.merge(*matched_lines)]
 
         # Filter by prefecture
         if prefecture:
             stations = [s for s in stations if s.prefecture == prefecture]
 
-        # Filter by line
-        if line:
-            stations = [
-                s
-                for s in stations
-                if s.line_name and line.lower() in s.line_name.lower()
-            ]
-
         return stations[:limit]
@@ -5,16 +5,26 @@ Japanese transit route search and station management functionality.
 """
 
 import asyncio
-import json
+import functools
 import logging
-from typing import Any
-
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.types import (
+    CallToolResult,
     TextContent,
     Tool,
 )
+from pydantic import TypeAdapter
 
 from ..core.exceptions import (
     NetworkError,
@@ -22,12 +32,221 @@ from ..core.exceptions import (
     ScrapingError,
     ValidationError,
 )
-from ..core.models import Route
+from ..core.models import Route, Station
 from ..core.scraper import YahooTransitScraper
 from ..crawler.station_crawler import StationSearcher
+from ..utils.json_compat import json_dumps
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Seconds a scraped route result is reused for an identical query
+ROUTE_CACHE_TTL = 60.0
+# Most route queries kept in the cache
+ROUTE_CACHE_SIZE = 256
+# Default number of routes scraped at once by search_routes_batch
+BATCH_ROUTE_CONCURRENCY = 5
+# Station searches run at once in worker threads
+STATION_SEARCH_CONCURRENCY = 4
+# Worker threads shared by all blocking tool work (scrapes and searches)
+TOOL_WORKER_THREADS = 16
+
+# How each route search_type is described in search_route output
+_SEARCH_TYPE_DISPLAY = {
+    "earliest": "fastest",
+    "cheapest": "cheapest",
+    "easiest": "easiest (fewest transfers)",
+}
+
+# Serializes route results straight from the models in pydantic's core
+_ROUTES_JSON = TypeAdapter(list[Route])
+
+
+# Fenced block wrapped around the JSON payload of tool responses
+_JSON_PREFIX = b"JSON Data:\n```json\n"
+_JSON_SUFFIX = b"\n```"
+
+
+def _json_block(payload: bytes, prefix: bytes = _JSON_PREFIX) -> str:
+    """Wrap serialized JSON in a fenced block, decoding it only once."""
+    return b"".join((prefix, payload, _JSON_SUFFIX)).decode()
+
+
+def _station_json(station: Station) -> dict[str, Any]:
+    """Build the JSON payload for a station returned by a tool.
+
+    Reads the attributes directly, which is several times faster than
+    ``model_dump`` for this flat model. A new dict is built on every call,
+    so it always reflects the station's current fields.
+    """
+    return {
+        "name": station.name,
+        "name_hiragana": station.name_hiragana,
+        "name_katakana": station.name_katakana,
+        "name_romaji": station.name_romaji,
+        "prefecture": station.prefecture,
+        "prefecture_id": station.prefecture_id,
+        "station_id": station.station_id,
+        "railway_company": station.railway_company,
+        "line_name": station.line_name,
+        "aliases": station.aliases,
+        "all_lines": station.all_lines,
+    }
+
+
+# Tool definitions advertised by list_tools; built once at import
+_TOOLS: list[Tool] = [
+    Tool(
+        name="search_route",
+        description="Search for transit routes between two Japanese stations",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "from_station": {
+                    "type": "string",
+                    "description": "Departure station name (in Japanese or English)",
+                },
+                "to_station": {
+                    "type": "string",
+                    "description": "Destination station name (in Japanese or English)",
+                },
+                "search_type": {
+                    "type": "string",
+                    "description": "Route search preference: 'earliest' (fastest), 'cheapest' (lowest cost), or 'easiest' (fewest transfers)",
+                    "enum": ["earliest", "cheapest", "easiest"],
+                    "default": "earliest",
+                },
+            },
+            "required": ["from_station", "to_station"],
+        },
+    ),
+    Tool(
+        name="search_stations",
+        description="Search for Japanese train stations by name or keyword with fuzzy matching",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Station name or search keyword (supports romaji, kanji, hiragana, katakana)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results to return",
+                    "default": 10,
+                    "minimum": 1,
+                    "maximum": 100,
+                },
+                "fuzzy_threshold": {
+                    "type": "integer",
+                    "description": "Minimum fuzzy match score (0-100). Lower = more lenient matching",
+                    "default": 70,
+                    "minimum": 0,
+                    "maximum": 100,
+                },
+                "exact": {
+                    "type": "boolean",
+                    "description": "If true, perform exact matching only (disables fuzzy search)",
+                    "default": False,
+                },
+                "show_scores": {
+                    "type": "boolean",
+                    "description": "If true, include matching scores in results",
+                    "default": False,
+                },
+            },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name="get_station_info",
+        description="Get detailed information about a specific Japanese train station",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "station_name": {
+                    "type": "string",
+                    "description": "Exact station name",
+                }
+            },
+            "required": ["station_name"],
+        },
+    ),
+    Tool(
+        name="list_station_database",
+        description="List all stations in the local database",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "prefecture": {
+                    "type": "string",
+                    "description": "Filter by prefecture (optional)",
+                },
+                "line": {
+                    "type": "string",
+                    "description": "Filter by railway line name (optional)",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results",
+                    "default": 50,
+                    "minimum": 1,
+                    "maximum": 1000,
+                },
+            },
+        },
+    ),
+    Tool(
+        name="search_routes_batch",
+        description="Search transit routes for several station pairs at once",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pairs": {
+                    "type": "array",
+                    "description": "Station pairs to search, each like a search_route call",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "from_station": {
+                                "type": "string",
+                                "description": "Departure station name",
+                            },
+                            "to_station": {
+                                "type": "string",
+                                "description": "Destination station name",
+                            },
+                            "search_type": {
+                                "type": "string",
+                                "enum": ["earliest", "cheapest", "easiest"],
+                                "default": "earliest",
+                            },
+                        },
+                        "required": ["from_station", "to_station"],
+                    },
+                    "minItems": 1,
+                    "maxItems": 20,
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "description": "Maximum routes searched at the same time",
+                    "default": BATCH_ROUTE_CONCURRENCY,
+                    "minimum": 1,
+                    "maximum": 10,
+                },
+            },
+            "required": ["pairs"],
+        },
+    ),
+]
+
+# Argument validators compiled once per tool. The MCP server's built-in
+# validation re-checks each schema against the metaschema on every call.
+_ARGUMENT_VALIDATORS = {
+    tool.name: validator_for(tool.inputSchema)(tool.inputSchema) for tool in _TOOLS
+}
+
 
 class TransitMCPServer:
     """MCP Server for Japanese Transit Search functionality."""
@@ -35,23 +254,96 @@ class TransitMCPServer:
     def __init__(self) -> None:
         """Initialize the Transit MCP Server."""
         self.server = Server("jp-transit-search")
-        self.scraper = YahooTransitScraper()
+        # Created on first route search; station-only sessions never need it
+        self._scraper: YahooTransitScraper | None = None
 
-        # Initialize station searcher with empty list initially
-        self.station_searcher = StationSearcher([])
+        # (from, to, search_type) -> (monotonic time scraped, scraper result)
+        self._route_cache: OrderedDict[tuple[str, str, str], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        # Exact (from, to, search_type) -> (scraper result, formatted response)
+        self._route_responses: OrderedDict[
+            tuple[str, str, str], tuple[Any, list[TextContent]]
+        ] = OrderedDict()
+        # Per-query locks so concurrent identical searches share one scrape
+        self._route_locks: dict[tuple[str, str, str], asyncio.Lock] = {}
+        # Searches holding or waiting on each per-query lock
+        self._route_lock_users: dict[tuple[str, str, str], int] = {}
+        # Bounds the worker threads used by fuzzy station searches
+        self._station_search_slots = asyncio.Semaphore(STATION_SEARCH_CONCURRENCY)
+        # Runs blocking scraper and searcher calls; threads start on demand
+        self._executor = ThreadPoolExecutor(
+            max_workers=TOOL_WORKER_THREADS, thread_name_prefix="transit-mcp"
+        )
 
-        # Load existing stations if available (read-only)
-        self._load_stations()
+        # Stations are loaded on first use (or in the background by main())
+        # so the server can answer MCP frames while the CSV is read
+        self._station_searcher: StationSearcher | None = None
+        self._stations_task: asyncio.Future[None] | None = None
 
         # Register handlers
         self._register_handlers()
 
+    @property
+    def scraper(self) -> YahooTransitScraper:
+        """Route scraper, created on first use."""
+        if self._scraper is None:
+            self._scraper = YahooTransitScraper()
+        return self._scraper
+
+    @scraper.setter
+    def scraper(self, scraper: YahooTransitScraper) -> None:
+        self._scraper = scraper
+
+    @property
+    def station_searcher(self) -> StationSearcher:
+        """Station searcher, loading the station CSV if not done yet."""
+        if self._station_searcher is None:
+            self._load_stations()
+        assert self._station_searcher is not None
+        return self._station_searcher
+
+    @station_searcher.setter
+    def station_searcher(self, station_searcher: StationSearcher) -> None:
+        self._station_searcher = station_searcher
+
+    def _start_station_load(self) -> asyncio.Future[None]:
+        """Start loading stations in a worker thread, if not already started."""
+        if self._stations_task is None:
+            self._stations_task = asyncio.ensure_future(
+                self._run_blocking(self._load_stations)
+            )
+        return self._stations_task
+
+    async def _get_station_searcher(self) -> StationSearcher:
+        """Get the station searcher without blocking the event loop on loading."""
+        if self._station_searcher is None:
+            # Shielded so a cancelled tool call does not abort the shared load
+            await asyncio.shield(self._start_station_load())
+        return self.station_searcher
+
+    def close(self) -> None:
+        """Stop the worker threads used for blocking tool calls."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run_blocking(
+        self, func: Callable[..., _T], *args: Any, **kwargs: Any
+    ) -> _T:
+        """Run a blocking call on the shared worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
     def _load_stations(self) -> None:
-        """Load stations from CSV file (read-only)."""
-        from pathlib import Path
+        """Load stations from the CSV file.
 
+        Station data is never modified. A pickled copy of the parsed CSV is
+        written next to it to speed up later starts, but only when the data
+        directory is writable.
+        """
         try:
-            # Try to load from CSV file only (read-only mode)
+            # Station data is read-only; only the parse cache may be written
             csv_file = Path("data/stations.csv")
             if csv_file.exists():
                 logger.info(f"Loading stations from CSV file: {csv_file}")
@@ -59,7 +351,9 @@ class TransitMCPServer:
                 from ..crawler.station_crawler import StationCrawler
 
                 temp_crawler = StationCrawler()
-                stations = temp_crawler.load_from_csv(csv_file)
+                stations = temp_crawler.load_from_csv_cached(
+                    csv_file, write_cache=os.access(csv_file.parent, os.W_OK)
+                )
                 self.station_searcher = StationSearcher(stations)
                 logger.info(f"Loaded {len(stations)} stations from CSV")
                 return
@@ -81,129 +375,47 @@ class TransitMCPServer:
 
     def _register_handlers(self) -> None:
         """Register MCP protocol handlers."""
+        # Tool name -> implementing method
+        self._tool_dispatch: dict[
+            str, Callable[[dict[str, Any]], Awaitable[list[TextContent]]]
+        ] = {
+            "search_route": self._search_route,
+            "search_stations": self._search_stations,
+            "get_station_info": self._get_station_info,
+            "list_station_database": self._list_station_database,
+            "search_routes_batch": self._search_routes_batch,
+        }
 
         @self.server.list_tools()
         async def handle_list_tools() -> list[Tool]:
             """List available tools."""
-            return [
-                Tool(
-                    name="search_route",
-                    description="Search for transit routes between two Japanese stations",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "from_station": {
-                                "type": "string",
-                                "description": "Departure station name (in Japanese or English)",
-                            },
-                            "to_station": {
-                                "type": "string",
-                                "description": "Destination station name (in Japanese or English)",
-                            },
-                            "search_type": {
-                                "type": "string",
-                                "description": "Route search preference: 'earliest' (fastest), 'cheapest' (lowest cost), or 'easiest' (fewest transfers)",
-                                "enum": ["earliest", "cheapest", "easiest"],
-                                "default": "earliest",
-                            },
-                        },
-                        "required": ["from_station", "to_station"],
-                    },
-                ),
-                Tool(
-                    name="search_stations",
-                    description="Search for Japanese train stations by name or keyword with fuzzy matching",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "Station name or search keyword (supports romaji, kanji, hiragana, katakana)",
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results to return",
-                                "default": 10,
-                                "minimum": 1,
-                                "maximum": 100,
-                            },
-                            "fuzzy_threshold": {
-                                "type": "integer",
-                                "description": "Minimum fuzzy match score (0-100). Lower = more lenient matching",
-                                "default": 70,
-                                "minimum": 0,
-                                "maximum": 100,
-                            },
-                            "exact": {
-                                "type": "boolean",
-                                "description": "If true, perform exact matching only (disables fuzzy search)",
-                                "default": False,
-                            },
-                            "show_scores": {
-                                "type": "boolean",
-                                "description": "If true, include matching scores in results",
-                                "default": False,
-                            },
-                        },
-                        "required": ["query"],
-                    },
-                ),
-                Tool(
-                    name="get_station_info",
-                    description="Get detailed information about a specific Japanese train station",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "station_name": {
-                                "type": "string",
-                                "description": "Exact station name",
-                            }
-                        },
-                        "required": ["station_name"],
-                    },
-                ),
-                Tool(
-                    name="list_station_database",
-                    description="List all stations in the local database",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "prefecture": {
-                                "type": "string",
-                                "description": "Filter by prefecture (optional)",
-                            },
-                            "line": {
-                                "type": "string",
-                                "description": "Filter by railway line name (optional)",
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of results",
-                                "default": 50,
-                                "minimum": 1,
-                                "maximum": 1000,
-                            },
-                        },
-                    },
-                ),
-            ]
+            return _TOOLS
 
-        @self.server.call_tool()
+        @self.server.call_tool(validate_input=False)
         async def handle_call_tool(
             name: str, arguments: dict[str, Any]
-        ) -> list[TextContent]:
+        ) -> list[TextContent] | CallToolResult:
             """Handle tool calls."""
+            validator = _ARGUMENT_VALIDATORS.get(name)
+            if validator is not None:
+                error = best_match(validator.iter_errors(arguments))
+                if error is not None:
+                    return CallToolResult(
+                        content=[
+                            TextContent(
+                                type="text",
+                                text=f"Input validation error: {error.message}",
+                            )
+                        ],
+                        isError=True,
+                    )
+
+            handler = self._tool_dispatch.get(name)
+            if handler is None:
+                return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
             try:
-                if name == "search_route":
-                    return await self._search_route(arguments)
-                elif name == "search_stations":
-                    return await self._search_stations(arguments)
-                elif name == "get_station_info":
-                    return await self._get_station_info(arguments)
-                elif name == "list_station_database":
-                    return await self._list_station_database(arguments)
-                else:
-                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
+                return await handler(arguments)
 
             except Exception as e:
                 logger.error(f"Error in tool {name}: {e}")
@@ -227,10 +439,17 @@ class TransitMCPServer:
             )
 
         try:
-            routes = self.scraper.search_route(
-                from_station, to_station, search_type=search_type
+            routes = await self._cached_route_search(
+                from_station, to_station, search_type
             )
 
+            # Reuse the formatted response while the cached scrape is unchanged
+            response_key = (from_station, to_station, search_type)
+            cached_response = self._route_responses.get(response_key)
+            if cached_response and cached_response[0] is routes:
+                self._route_responses.move_to_end(response_key)
+                return list(cached_response[1])
+
             # Allow scraper to return either a single Route or a list of Route
             if isinstance(routes, Route):
                 pass  # Will be normalized to list below
@@ -259,41 +478,41 @@ class TransitMCPServer:
                 return [TextContent(type="text", text="No routes found")]
 
             # Build a human-readable summary for all found routes
-            result_text = ""
+            parts: list[str] = []
 
             # Add validation warnings if any
             if validation_warnings:
-                result_text += "⚠️  **Validation Warnings:**\n"
+                parts.append("⚠️  **Validation Warnings:**\n")
                 for warning in validation_warnings:
-                    result_text += f"   • {warning}\n"
-                result_text += "\n"
+                    parts.append(f"   • {warning}\n")
+                parts.append("\n")
 
-            search_type_display = {
-                "earliest": "fastest",
-                "cheapest": "cheapest",
-                "easiest": "easiest (fewest transfers)",
-            }.get(search_type, search_type)
+            search_type_display = _SEARCH_TYPE_DISPLAY.get(search_type, search_type)
 
-            result_text += f"**Found {len(routes_list)} routes from {from_station} to {to_station}** ({search_type_display} preference):**\n\n"
+            parts.append(
+                f"**Found {len(routes_list)} routes from {from_station} to {to_station}** ({search_type_display} preference):**\n\n"
+            )
 
             for idx, r in enumerate(routes_list, 1):
-                result_text += (
+                parts.append(
                     f"{idx}. **Route {idx}: {r.from_station} → {r.to_station}**\n"
                 )
-                result_text += f"   • Duration: {r.duration}\n"
-                result_text += f"   • Cost: {r.cost}\n"
-                result_text += f"   • Transfers: {r.transfer_count}\n"
-                result_text += f"   • Departure: {r.departure_time or 'N/A'}\n"
-                result_text += f"   • Arrival: {r.arrival_time or 'N/A'}\n"
+                parts.append(f"   • Duration: {r.duration}\n")
+                parts.append(f"   • Cost: {r.cost}\n")
+                parts.append(f"   • Transfers: {r.transfer_count}\n")
+                parts.append(f"   • Departure: {r.departure_time or 'N/A'}\n")
+                parts.append(f"   • Arrival: {r.arrival_time or 'N/A'}\n")
 
                 # Add per-route transfer details
                 if r.transfers:
-                    result_text += "   Route Details:\n"
+                    parts.append("   Route Details:\n")
                     for t_i, transfer in enumerate(r.transfers, 1):
-                        result_text += f"     {t_i}. {transfer.from_station} → {transfer.to_station}"
+                        parts.append(
+                            f"     {t_i}. {transfer.from_station} → {transfer.to_station}"
+                        )
                         if transfer.line_name:
-                            result_text += f" ({transfer.line_name})"
-                        result_text += (
+                            parts.append(f" ({transfer.line_name})")
+                        parts.append(
                             f" - {transfer.duration_minutes}min - ¥{transfer.cost_yen}"
                         )
 
@@ -306,39 +525,120 @@ class TransitMCPServer:
                                 )
                             if transfer.arrival_platform:
                                 platform_info.append(f"To: {transfer.arrival_platform}")
-                            result_text += f" | Platform: {' | '.join(platform_info)}"
+                            parts.append(f" | Platform: {' | '.join(platform_info)}")
 
                         # Add riding position if available
                         if transfer.riding_position:
-                            result_text += f" | Position: {transfer.riding_position}"
+                            parts.append(f" | Position: {transfer.riding_position}")
 
-                        result_text += "\n"
+                        parts.append("\n")
 
                         # Add intermediate stations if available
                         if transfer.intermediate_stations:
-                            result_text += "        Intermediate stations: "
+                            parts.append("        Intermediate stations: ")
                             station_names = [
                                 f"{station.name} ({station.arrival_time})"
                                 for station in transfer.intermediate_stations
                             ]
-                            result_text += " → ".join(station_names) + "\n"
-                result_text += "\n"
+                            parts.append(" → ".join(station_names) + "\n")
+                parts.append("\n")
 
-            # JSON representation as a list
-            routes_data = [r.model_dump(mode="json") for r in routes_list]
-
-            return [
-                TextContent(type="text", text=result_text),
+            response = [
+                TextContent(type="text", text="".join(parts)),
                 TextContent(
                     type="text",
-                    text=f"JSON Data:\n```json\n{json.dumps(routes_data, indent=2, ensure_ascii=False)}\n```",
+                    text=_json_block(_ROUTES_JSON.dump_json(routes_list, indent=2)),
                 ),
             ]
+            self._route_responses[response_key] = (routes, response)
+            self._route_responses.move_to_end(response_key)
+            if len(self._route_responses) > ROUTE_CACHE_SIZE:
+                self._route_responses.popitem(last=False)
+            return list(response)
 
         except (ValidationError, RouteNotFoundError, ScrapingError, NetworkError) as e:
             return [TextContent(type="text", text=f"Route search failed: {str(e)}")]
 
-    def _is_romaji_name(self, name: str) -> bool:
+    async def _cached_route_search(
+        self, from_station: str, to_station: str, search_type: str
+    ) -> Any:
+        """Scrape routes, reusing recent results for the same query.
+
+        Results are kept for ``ROUTE_CACHE_TTL`` seconds in an LRU of
+        ``ROUTE_CACHE_SIZE`` queries. Failed searches are not cached.
+        """
+        key = (from_station.strip().lower(), to_station.strip().lower(), search_type)
+        lock = self._route_locks.setdefault(key, asyncio.Lock())
+        self._route_lock_users[key] = self._route_lock_users.get(key, 0) + 1
+
+        try:
+            async with lock:
+                cached = self._route_cache.get(key)
+                if cached and time.monotonic() - cached[0] < ROUTE_CACHE_TTL:
+                    self._route_cache.move_to_end(key)
+                    return cached[1]
+
+                # The scrape blocks on network I/O, so run it in a worker
+                # thread and let other searches proceed meanwhile
+                routes = await self._run_blocking(
+                    self.scraper.search_route,
+                    from_station,
+                    to_station,
+                    search_type=search_type,
+                )
+
+                self._route_cache[key] = (time.monotonic(), routes)
+                self._route_cache.move_to_end(key)
+                if len(self._route_cache) > ROUTE_CACHE_SIZE:
+                    self._route_cache.popitem(last=False)
+                return routes
+        finally:
+            # Drop the lock once no other search for this query holds or
+            # waits on it. lock.locked() is not enough: release() clears it
+            # before the next waiter runs.
+            users = self._route_lock_users[key] - 1
+            if users:
+                self._route_lock_users[key] = users
+            else:
+                del self._route_lock_users[key]
+                if self._route_locks.get(key) is lock:
+                    del self._route_locks[key]
+
+    async def _search_routes_batch(
+        self, arguments: dict[str, Any]
+    ) -> list[TextContent]:
+        """Search transit routes for several station pairs concurrently."""
+        pairs = arguments["pairs"]
+        route_slots = asyncio.Semaphore(
+            arguments.get("max_concurrency", BATCH_ROUTE_CONCURRENCY)
+        )
+
+        async def search_pair(pair: dict[str, Any]) -> list[TextContent]:
+            async with route_slots:
+                return await self._search_route(pair)
+
+        results = await asyncio.gather(
+            *(search_pair(pair) for pair in pairs), return_exceptions=True
+        )
+
+        contents = []
+        for idx, (pair, result) in enumerate(zip(pairs, results, strict=True), 1):
+            contents.append(
+                TextContent(
+                    type="text",
+                    text=f"## Pair {idx}: {pair.get('from_station')} → {pair.get('to_station')}",
+                )
+            )
+            if isinstance(result, BaseException):
+                contents.append(
+                    TextContent(type="text", text=f"Route search failed: {result}")
+                )
+            else:
+                contents.extend(result)
+        return contents
+
+    @staticmethod
+    def _is_romaji_name(name: str) -> bool:
         """Check if a station name appears to be in romaji (ASCII characters only)."""
         return name.isascii() and name.isalpha()
 
@@ -350,25 +650,29 @@ class TransitMCPServer:
         exact = arguments.get("exact", False)
         show_scores = arguments.get("show_scores", False)
 
-        try:
+        def run_search() -> tuple[list[Station], list[int] | None]:
             if show_scores:
                 # Use fuzzy_search method that returns scores
-                station_scores = self.station_searcher.fuzzy_search(
+                station_scores = searcher.fuzzy_search(
                     query, limit=limit, threshold=fuzzy_threshold
                 )
                 stations = [station for station, _score in station_scores]
                 scores = [score for _station, score in station_scores]
-            else:
-                # Use regular search methods
-                if exact:
-                    stations = self.station_searcher.search_by_name(query, exact=True)[
-                        :limit
-                    ]
-                else:
-                    stations = self.station_searcher.search_stations(
-                        query, limit=limit, fuzzy_threshold=fuzzy_threshold
-                    )
-                scores = None
+                return stations, scores
+            # Use regular search methods
+            if exact:
+                stations = searcher.search_by_name(query, exact=True)
+                return stations[:limit], None
+            stations = searcher.search_stations(
+                query, limit=limit, fuzzy_threshold=fuzzy_threshold
+            )
+            return stations, None
+
+        try:
+            searcher = await self._get_station_searcher()
+            # Fuzzy scoring is CPU-bound, so keep it off the event loop
+            async with self._station_search_slots:
+                stations, scores = await self._run_blocking(run_search)
 
             if not stations:
                 search_type = (
@@ -383,47 +687,35 @@ class TransitMCPServer:
 
             # Build result text
             search_type = "exact" if exact else f"fuzzy (threshold: {fuzzy_threshold})"
-            result_text = f"**Found {len(stations)} stations matching '{query}' ({search_type} search):**\n\n"
+            parts = [
+                f"**Found {len(stations)} stations matching '{query}' ({search_type} search):**\n\n"
+            ]
 
             for i, station in enumerate(stations, 1):
-                result_text += f"{i}. **{station.name}**"
+                parts.append(f"{i}. **{station.name}**")
                 if show_scores and scores:
-                    result_text += f" (Score: {scores[i - 1]}%)"
+                    parts.append(f" (Score: {scores[i - 1]}%)")
                 if station.station_id:
-                    result_text += f" (Code: {station.station_id})"
+                    parts.append(f" (Code: {station.station_id})")
                 if station.prefecture:
-                    result_text += f" - {station.prefecture}"
+                    parts.append(f" - {station.prefecture}")
                 if station.line_name:
-                    result_text += f"\n   Line: {station.line_name}"
+                    parts.append(f"\n   Line: {station.line_name}")
                 if station.name_romaji:
-                    result_text += f"\n   Romaji: {station.name_romaji}"
-                result_text += "\n\n"
+                    parts.append(f"\n   Romaji: {station.name_romaji}")
+                parts.append("\n\n")
 
             # Also return JSON data with enhanced fields
-            stations_data = []
-            for i, s in enumerate(stations):
-                station_data = {
-                    "name": s.name,
-                    "name_hiragana": s.name_hiragana,
-                    "name_katakana": s.name_katakana,
-                    "name_romaji": s.name_romaji,
-                    "prefecture": s.prefecture,
-                    "prefecture_id": s.prefecture_id,
-                    "station_id": s.station_id,
-                    "railway_company": s.railway_company,
-                    "line_name": s.line_name,
-                    "aliases": s.aliases,
-                    "all_lines": s.all_lines,
-                }
-                if show_scores and scores:
-                    station_data["search_score"] = scores[i]  # type: ignore[assignment]
-                stations_data.append(station_data)
+            stations_data = [_station_json(s) for s in stations]
+            if show_scores and scores:
+                for station_data, score in zip(stations_data, scores, strict=True):
+                    station_data["search_score"] = score
 
             return [
-                TextContent(type="text", text=result_text),
+                TextContent(type="text", text="".join(parts)),
                 TextContent(
                     type="text",
-                    text=f"JSON Data:\n```json\n{json.dumps(stations_data, indent=2, ensure_ascii=False)}\n```",
+                    text=_json_block(json_dumps(stations_data, indent=True)),
                 ),
             ]
 
@@ -435,58 +727,48 @@ class TransitMCPServer:
         station_name = arguments["station_name"]
 
         try:
-            station = self.station_searcher.get_station_by_name(station_name)
+            searcher = await self._get_station_searcher()
+            station = searcher.get_station_by_name(station_name)
 
             if not station:
                 return [
                     TextContent(type="text", text=f"Station '{station_name}' not found")
                 ]
 
-            result_text = f"**{station.name}**\n\n"
+            parts = [f"**{station.name}**\n\n"]
 
             if station.station_id:
-                result_text += f"• **Station Code:** {station.station_id}\n"
+                parts.append(f"• **Station Code:** {station.station_id}\n")
 
             if station.prefecture:
-                result_text += f"• **Prefecture:** {station.prefecture}\n"
+                parts.append(f"• **Prefecture:** {station.prefecture}\n")
 
             if station.line_name:
-                result_text += f"• **Line:** {station.line_name}\n"
+                parts.append(f"• **Line:** {station.line_name}\n")
 
             if station.railway_company:
-                result_text += f"• **Company:** {station.railway_company}\n"
+                parts.append(f"• **Company:** {station.railway_company}\n")
 
             if station.name_hiragana:
-                result_text += f"• **Hiragana:** {station.name_hiragana}\n"
+                parts.append(f"• **Hiragana:** {station.name_hiragana}\n")
 
             if station.name_katakana:
-                result_text += f"• **Katakana:** {station.name_katakana}\n"
+                parts.append(f"• **Katakana:** {station.name_katakana}\n")
 
             if station.name_romaji:
-                result_text += f"• **Romaji:** {station.name_romaji}\n"
+                parts.append(f"• **Romaji:** {station.name_romaji}\n")
 
             if station.all_lines:
-                result_text += f"• **All Lines:** {', '.join(station.all_lines)}\n"
-
-            station_data = {
-                "name": station.name,
-                "name_hiragana": station.name_hiragana,
-                "name_katakana": station.name_katakana,
-                "name_romaji": station.name_romaji,
-                "prefecture": station.prefecture,
-                "prefecture_id": station.prefecture_id,
-                "station_id": station.station_id,
-                "railway_company": station.railway_company,
-                "line_name": station.line_name,
-                "aliases": station.aliases,
-                "all_lines": station.all_lines,
-            }
+                parts.append(f"• **All Lines:** {', '.join(station.all_lines)}\n")
 
             return [
-                TextContent(type="text", text=result_text),
+                TextContent(type="text", text="".join(parts)),
                 TextContent(
                     type="text",
-                    text=f"\nJSON Data:\n```json\n{json.dumps(station_data, indent=2, ensure_ascii=False)}\n```",
+                    text=_json_block(
+                        json_dumps(_station_json(station), indent=True),
+                        prefix=b"\n" + _JSON_PREFIX,
+                    ),
                 ),
             ]
 
@@ -504,7 +786,8 @@ class TransitMCPServer:
         limit = arguments.get("limit", 50)
 
         try:
-            stations = self.station_searcher.list_stations(
+            searcher = await self._get_station_searcher()
+            stations = searcher.list_stations(
                 prefecture=prefecture, line=line, limit=limit
             )
 
@@ -522,24 +805,24 @@ class TransitMCPServer:
                     TextContent(type="text", text=f"No stations found{filter_desc}")
                 ]
 
-            result_text = f"**Station Database ({len(stations)} stations"
+            parts = [f"**Station Database ({len(stations)} stations"]
             if prefecture:
-                result_text += f", prefecture: {prefecture}"
+                parts.append(f", prefecture: {prefecture}")
             if line:
-                result_text += f", line: {line}"
-            result_text += "):**\n\n"
+                parts.append(f", line: {line}")
+            parts.append("):**\n\n")
 
             for i, station in enumerate(stations, 1):
-                result_text += f"{i}. **{station.name}**"
+                parts.append(f"{i}. **{station.name}**")
                 if station.station_id:
-                    result_text += f" (Code: {station.station_id})"
+                    parts.append(f" (Code: {station.station_id})")
                 if station.prefecture:
-                    result_text += f" - {station.prefecture}"
+                    parts.append(f" - {station.prefecture}")
                 if station.line_name:
-                    result_text += f"\n   Line: {station.line_name}"
-                result_text += "\n\n"
+                    parts.append(f"\n   Line: {station.line_name}")
+                parts.append("\n\n")
 
-            return [TextContent(type="text", text=result_text)]
+            return [TextContent(type="text", text="".join(parts))]
 
         except Exception as e:
             return [TextContent(type="text", text=f"Failed to list stations: {str(e)}")]
@@ -557,20 +840,25 @@ async def main() -> None:
     # Run the server with stdio transport using the correct MCP approach
     from mcp.server.stdio import stdio_server
 
-    async with stdio_server() as (read_stream, write_stream):
-        logger.info("MCP Server running with stdio transport")
-        await server_instance.server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="jp-transit-search",
-                server_version="1.0.0",
-                capabilities=server_instance.server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            logger.info("MCP Server running with stdio transport")
+            # Read the station CSV while the client initializes
+            server_instance._start_station_load()
+            await server_instance.server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="jp-transit-search",
+                    server_version="1.0.0",
+                    capabilities=server_instance.server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        server_instance.close()
 
 
 def main_sync() -> None:
@@ -2,11 +2,23 @@
 
 import re
 import threading
+from functools import lru_cache
 from typing import Any
 
 import jaconv
 import pykakasi
 
+# Patterns used by normalize_for_search
+_STATION_SUFFIX_RE = re.compile(r"[駅站]$")
+# Particles plus spaces and separators, stripped in a single pass
+_IGNORED_CHARS_RE = re.compile(r"[のノ\s\-ー−・]")
+
+# Patterns used by is_likely_romaji
+_NON_LETTER_RE = re.compile(r'[\s\d\-\.,;:!?()[\]{}"\'/\\]+')
+_LATIN_RE = re.compile(r"[a-zA-Z]")
+# Hiragana and katakana are adjacent blocks, followed by CJK kanji
+_JAPANESE_RE = re.compile(r"[\u3040-\u30ff\u4e00-\u9faf]")
+
 
 class JapaneseTextConverter:
     """Handles conversion between Japanese text formats."""
@@ -47,13 +59,11 @@ class JapaneseTextConverter:
     def normalize_for_search(self, text: str) -> str:
         """Normalize text for fuzzy search by removing common suffixes and particles."""
         # Remove common station suffixes
-        text = re.sub(r"[駅站]$", "", text)
-
-        # Remove common particles and suffixes that might interfere with search
-        text = re.sub(r"[のノ]", "", text)
+        text = _STATION_SUFFIX_RE.sub("", text)
 
-        # Normalize spaces and special characters
-        text = re.sub(r"[\s\-ー−・]", "", text)
+        # Remove particles that might interfere with search, and normalize
+        # spaces and special characters
+        text = _IGNORED_CHARS_RE.sub("", text)
 
         return text.strip()
 
@@ -102,9 +112,19 @@ def convert_to_romaji(text: str) -> str:
     return get_converter().to_romaji(text)
 
 
+@lru_cache(maxsize=50_000)
+def _cached_text_variants(text: str) -> tuple[tuple[str, str], ...]:
+    """Generate text variants once per distinct name, as a hashable tuple."""
+    return tuple(get_converter().generate_all_variants(text).items())
+
+
 def generate_text_variants(text: str) -> dict[str, str]:
-    """Generate all text variants for a station name."""
-    return get_converter().generate_all_variants(text)
+    """Generate all text variants for a station name.
+
+    Results are cached, since transfer stations appear on many lines.
+    A fresh dict is returned on each call so callers may modify it.
+    """
+    return dict(_cached_text_variants(text))
 
 
 def is_likely_romaji(text: str) -> bool:
@@ -120,28 +140,23 @@ def is_likely_romaji(text: str) -> bool:
         return False
 
     # Remove spaces, punctuation, and numbers for analysis
-    clean_text = re.sub(r'[\s\d\-\.,;:!?()[\]{}"\'/\\]+', "", text)
+    clean_text = _NON_LETTER_RE.sub("", text)
 
     if not clean_text:
         return False
 
     # Count Latin characters (a-z, A-Z)
-    latin_chars = len(re.findall(r"[a-zA-Z]", clean_text))
-
-    # Count Japanese characters (hiragana, katakana, kanji)
-    hiragana_chars = len(re.findall(r"[\u3040-\u309f]", clean_text))
-    katakana_chars = len(re.findall(r"[\u30a0-\u30ff]", clean_text))
-    kanji_chars = len(re.findall(r"[\u4e00-\u9faf]", clean_text))
-
-    japanese_chars = hiragana_chars + katakana_chars + kanji_chars
+    latin_chars = len(_LATIN_RE.findall(clean_text))
     total_chars = len(clean_text)
 
     # If more than 70% of characters are Latin, likely romaji
     if total_chars > 0 and latin_chars / total_chars > 0.7:
         return True
 
-    # If there are Latin characters but no Japanese characters, likely romaji
-    if latin_chars > 0 and japanese_chars == 0:
+    # If there are Latin characters but no Japanese characters (hiragana,
+    # katakana, kanji), likely romaji. Only presence matters, so stop at the
+    # first Japanese character.
+    if latin_chars > 0 and _JAPANESE_RE.search(clean_text) is None:
         return True
 
     return False
@@ -0,0 +1,61 @@
+"""JSON helpers that use orjson when it is installed."""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on installed extras
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+            (``orjson.JSONDecodeError`` is a subclass)
+    """
+    if ORJSON_AVAILABLE:
+        if isinstance(data, str) and type(data) is not str:
+            # orjson rejects str subclasses such as bs4's NavigableString
+            data = str(data)
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    default: Callable[[Any], Any] | None = None,
+) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Non-ASCII text is written as-is rather than escaped.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Called for objects the encoder does not support natively;
+            should return a serializable value or raise ``TypeError``
+
+    Returns:
+        JSON document as bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_INDENT_2 if indent else None
+        )
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, default=default
+    ).encode("utf-8")
@@ -1,6 +1,7 @@
 """Tests for the station crawler module."""
 
 import csv
+import os
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -8,8 +9,15 @@ from unittest.mock import Mock, patch
 import pytest
 from bs4 import BeautifulSoup
 
+from jp_transit_search.core.exceptions import ScrapingError
 from jp_transit_search.core.models import Station
-from jp_transit_search.crawler.station_crawler import StationCrawler, StationSearcher
+from jp_transit_search.crawler.station_crawler import (
+    StationCrawler,
+    StationSearcher,
+    _parse_station_href,
+    _station_key,
+    _station_row,
+)
 
 
 class TestStationCrawler:
@@ -23,6 +31,16 @@ class TestStationCrawler:
         assert crawler.stations == []
         assert "User-Agent" in crawler.session.headers
 
+    def test_init_session_pooling(self):
+        """Test that the Yahoo host uses a pooled keep-alive adapter."""
+        crawler = StationCrawler()
+        adapter = crawler.session.get_adapter("https://transit.yahoo.co.jp/station/1")
+        assert adapter is crawler.session.get_adapter("http://example.com/")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        assert crawler.session.headers["Connection"] == "keep-alive"
+
     def test_init_default_timeout(self):
         """Test crawler initialization with default timeout."""
         crawler = StationCrawler()
@@ -104,6 +122,19 @@ class TestStationCrawler:
             assert rows[1]["name_katakana"] == ""
             assert rows[1]["name_romaji"] == ""
 
+    def test_station_row_reflects_updated_lists(self):
+        """Test CSV rows join aliases and lines as they are when written."""
+        station = Station(name="横浜", aliases=["ヨコハマ"], all_lines=["京急本線"])
+        assert _station_row(station)[-2:] == ("ヨコハマ", "京急本線")
+
+        station.aliases = ["ヨコハマ", "yokohama"]
+        station.all_lines.append("JR東海道本線")
+        assert _station_row(station)[-2:] == (
+            "ヨコハマ|yokohama",
+            "京急本線|JR東海道本線",
+        )
+        assert _station_row(Station(name="横浜", aliases=None))[-2:] == ("", "")
+
     def test_save_to_csv_creates_parent_directory(self):
         """Test that save_to_csv creates parent directories."""
         stations = [Station(name="テスト", prefecture="東京都")]
@@ -166,6 +197,55 @@ class TestStationCrawler:
         finally:
             csv_path.unlink()
 
+    def test_load_from_csv_cached(self):
+        """Test the pickled station cache is reused until the CSV changes."""
+        stations = [Station(name="新宿", prefecture="東京都", station_id="12345")]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "stations.csv"
+            crawler = StationCrawler()
+            crawler.save_to_csv(stations, csv_path)
+
+            first = crawler.load_from_csv_cached(csv_path)
+            assert csv_path.with_suffix(".pkl").exists()
+
+            with patch.object(crawler, "load_from_csv") as mock_load:
+                assert crawler.load_from_csv_cached(csv_path) == first
+                mock_load.assert_not_called()
+
+            # A newer CSV invalidates the cache
+            crawler.save_to_csv(stations * 2, csv_path)
+            stat = csv_path.stat()
+            os.utime(csv_path, (stat.st_atime, stat.st_mtime + 10))
+            assert len(crawler.load_from_csv_cached(csv_path)) == 2
+
+            # A cache written for another Station model version is rebuilt
+            with (
+                patch(
+                    "jp_transit_search.crawler.station_crawler._station_cache_key",
+                    return_value=("other",),
+                ),
+                patch.object(
+                    crawler, "load_from_csv", wraps=crawler.load_from_csv
+                ) as mock_load,
+            ):
+                assert len(crawler.load_from_csv_cached(csv_path)) == 2
+                mock_load.assert_called_once_with(csv_path)
+
+    def test_load_from_csv_cached_without_writing(self):
+        """Test write_cache=False leaves the CSV directory untouched."""
+        stations = [Station(name="新宿", prefecture="東京都", station_id="12345")]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = Path(tmp_dir) / "stations.csv"
+            crawler = StationCrawler()
+            crawler.save_to_csv(stations, csv_path)
+
+            loaded = crawler.load_from_csv_cached(csv_path, write_cache=False)
+
+            assert [s.name for s in loaded] == ["新宿"]
+            assert sorted(p.name for p in Path(tmp_dir).iterdir()) == ["stations.csv"]
+
     def test_load_from_csv_empty_values(self):
         """Test loading CSV with empty values."""
         csv_content = (
@@ -199,6 +279,124 @@ class TestStationCrawler:
         finally:
             csv_path.unlink()
 
+    def test_load_existing_stations_keys(self):
+        """Test dedup keys loaded from an existing CSV."""
+        csv_content = (
+            "name,prefecture,station_id,railway_company,line_name,aliases,all_lines\n"
+            "渋谷,東京都,22715,JR,山手線,しぶや|shibuya,山手線\n"
+            "テスト駅,東京都,,,,,\n"
+            "無名駅,,,,,,\n"
+        )
+
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".csv", encoding="utf-8", delete=False
+        ) as f:
+            f.write(csv_content)
+            csv_path = Path(f.name)
+
+        try:
+            crawler = StationCrawler()
+            crawler._load_existing_stations(csv_path)
+
+            # Keys must match those generated while crawling
+            expected = {
+                _station_key(s.station_id, s.name, s.prefecture)
+                for s in crawler.load_from_csv(csv_path)
+            }
+            assert crawler.existing_stations == expected
+            assert len(expected) == 3
+            assert 22715 in crawler.existing_stations
+            assert _station_key(None, "テスト駅", "東京都") in crawler.existing_stations
+        finally:
+            csv_path.unlink()
+
+    def test_get_company_from_line(self):
+        """Test railway company inference from line names."""
+        crawler = StationCrawler()
+        assert crawler._get_company_from_line("JR山手線") == "JR東日本"
+        assert crawler._get_company_from_line("東京メトロ銀座線") == "東京メトロ"
+        assert crawler._get_company_from_line("都営浅草線") == "都営地下鉄"
+        assert StationCrawler._get_company_from_line("小田急線") == "小田急電鉄"
+        assert StationCrawler._get_company_from_line("京急本線") == "京浜急行電鉄"
+        assert StationCrawler._get_company_from_line("東急東横線") == "その他"
+
+    def test_station_key(self):
+        """Test integer dedup keys for stations with and without IDs."""
+        assert _station_key("22715", "渋谷", "東京都") == 22715
+        hashed = _station_key(None, "テスト駅", "東京都")
+        assert hashed == _station_key("", "テスト駅", "東京都")
+        assert hashed >= 1 << 63
+        assert hashed != _station_key(None, "テスト駅", "神奈川県")
+        assert _station_key(None, "無名駅", None) == _station_key(None, "無名駅", "")
+
+    def test_extract_station_info_from_url(self):
+        """Test station link query parameters are parsed and cached."""
+        crawler = StationCrawler()
+        href = "/station/22715?pref=13&company=JR東日本&line=山手線"
+        expected = {"pref": "13", "company": "JR東日本", "line": "山手線"}
+
+        assert crawler._extract_station_info_from_url(href, "") == expected
+        hits = _parse_station_href.cache_info().hits
+        assert crawler._extract_station_info_from_url(href, "") == expected
+        assert _parse_station_href.cache_info().hits == hits + 1
+        assert crawler._extract_station_info_from_url("/station/1", "") == {
+            "pref": "",
+            "company": "",
+            "line": "",
+        }
+
+    def test_claim_station_key(self):
+        """Test recording station keys and counting duplicates."""
+        crawler = StationCrawler()
+        crawler.existing_stations = {22715}
+
+        assert crawler._claim_station_key(22741) is True
+        assert crawler._claim_station_key(22741) is False
+        assert crawler._claim_station_key(22715) is False
+        assert crawler.existing_stations == {22715, 22741}
+        assert crawler.progress.duplicates_filtered == 2
+
+    def test_save_crawl_state_atomic_and_throttled(self):
+        """Test crawl state saves replace the file and throttle checkpoints."""
+        from jp_transit_search.crawler.station_crawler import CrawlState
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            state_file = Path(tmp_dir) / "state.json"
+            crawler = StationCrawler()
+            crawler.state_file = state_file
+
+            state = CrawlState(completed_prefectures=["13_東京都"])
+            crawler._save_crawl_state(state)
+            assert list(Path(tmp_dir).iterdir()) == [state_file]
+
+            # A checkpoint right after a save is skipped
+            state.completed_prefectures.append("14_神奈川県")
+            crawler._save_crawl_state(state, force=False)
+            assert crawler._load_crawl_state().completed_prefectures == ["13_東京都"]
+
+            crawler._save_crawl_state(state)
+            assert crawler._load_crawl_state().completed_prefectures == [
+                "13_東京都",
+                "14_神奈川県",
+            ]
+
+    def test_flush_stations_streams_to_output(self):
+        """Test that batches go only to the CSV when an output path is set."""
+        batch = [Station(name="渋谷", prefecture="東京都", station_id="22715")]
+
+        crawler = StationCrawler()
+        crawler._flush_stations(batch)
+        assert crawler.stations == batch
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            crawler = StationCrawler()
+            crawler.output_path = Path(tmp_dir) / "stations.csv"
+            crawler._flush_stations(batch)
+
+            assert crawler.stations == []
+            saved = crawler.load_from_csv(crawler.output_path)
+            assert [(s.name, s.station_id) for s in saved] == [("渋谷", "22715")]
+
     def test_deduplicate_stations(self):
         """Test station deduplication."""
         # Create duplicate stations
@@ -212,9 +410,11 @@ class TestStationCrawler:
         ]
 
         crawler = StationCrawler()
-        crawler.stations = stations
+        crawler._collect_stations(stations[:2])
+        crawler._collect_stations(stations[2:])
 
         unique_stations = crawler._deduplicate_stations()
+        assert unique_stations is crawler.stations
 
         assert len(unique_stations) == 3
         names_prefs = [(s.name, s.prefecture) for s in unique_stations]
@@ -290,6 +490,12 @@ class TestStationSearcher:
         assert "神奈川県" in searcher.prefecture_index
         assert len(searcher.prefecture_index["神奈川県"]) == 2
 
+        # Lowercased search terms mirror the original terms
+        assert searcher.search_terms_lower[0] == [
+            t.lower() for t in searcher.search_terms[0]
+        ]
+        assert "shinjuku" in searcher.search_terms_lower[0]
+
     def test_search_by_name_exact(self, sample_stations):
         """Test exact name search."""
         searcher = StationSearcher(sample_stations)
@@ -326,6 +532,28 @@ class TestStationSearcher:
         assert len(results) == 1
         assert results[0].name == "新宿"
 
+    def test_search_by_name_substring(self, sample_stations):
+        """Test substring matches found through the n-gram index."""
+        searcher = StationSearcher(sample_stations)
+
+        # Longer than the n-gram size, so candidates must be verified
+        results = searcher.search_by_name("yokoham")
+        assert [s.name for s in results] == ["新横浜", "横浜"]
+
+        # Short queries use the smaller n-grams
+        results = searcher.search_by_name("横浜")
+        assert [s.name for s in results] == ["横浜", "新横浜"]
+
+        assert searcher.search_by_name("qqqq") == []
+
+    def test_search_by_name_exact_alias_priority(self, sample_stations):
+        """Test that exact alias matches take priority over other matches."""
+        searcher = StationSearcher(sample_stations)
+
+        # "Shinjuku" is an alias of 新宿 only; 新宿三丁目 is just a substring match
+        results = searcher.search_by_name("SHINJUKU")
+        assert [s.name for s in results] == ["新宿"]
+
     def test_search_by_prefecture(self, sample_stations):
         """Test prefecture search."""
         searcher = StationSearcher(sample_stations)
@@ -349,6 +577,28 @@ class TestStationSearcher:
         results = searcher.search_by_prefecture("存在しない県")
         assert len(results) == 0
 
+    def test_list_stations_filters(self):
+        """Test listing stations by prefecture and case-insensitive line."""
+        stations = [
+            Station(name="新宿", prefecture="東京都", line_name="JR Yamanote"),
+            Station(name="渋谷", prefecture="東京都", line_name="東急東横線"),
+            Station(name="横浜", prefecture="神奈川県", line_name="東急東横線"),
+            Station(name="品川", prefecture="東京都"),
+        ]
+        searcher = StationSearcher(stations)
+
+        assert searcher.list_stations(limit=2) == stations[:2]
+        assert searcher.list_stations(prefecture="東京都") == [
+            stations[0],
+            stations[1],
+            stations[3],
+        ]
+        assert searcher.list_stations(line="東横") == [stations[1], stations[2]]
+        assert searcher.list_stations(prefecture="東京都", line="yamanote") == [
+            stations[0]
+        ]
+        assert searcher.list_stations(prefecture="存在しない県") == []
+
     def test_get_all_prefectures(self, sample_stations):
         """Test getting all prefectures."""
         searcher = StationSearcher(sample_stations)
@@ -745,7 +995,7 @@ class TestStationDetailExtraction:
         # Mock the HTTP response to return our HTML sample
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = html_content
+        mock_response.content = html_content.encode("utf-8")
 
         with patch.object(crawler.session, "get", return_value=mock_response):
             details = crawler._get_station_details("/station/20042")
@@ -855,6 +1105,90 @@ class TestStationDetailExtraction:
             prefecture == "北海道"
         )  # Enhanced implementation now handles all 47 prefectures
 
+    def test_prefecture_from_url_code_formats(self):
+        """Test padded, unpadded and unknown prefecture codes in URLs."""
+        crawler = StationCrawler()
+        base = "https://transit.yahoo.co.jp/station"
+        assert crawler._get_prefecture_from_url(f"{base}/1/JR") == "北海道"
+        assert crawler._get_prefecture_from_url(f"{base}/pref/14/") == "神奈川県"
+        assert crawler._get_prefecture_from_url(f"{base}/47/x") == "沖縄県"
+        assert crawler._get_prefecture_from_url(f"{base}/99/x") == "東京都"
+
+        # With several code segments the lowest known code wins, by value
+        assert crawler._get_prefecture_from_url(f"{base}/27/14/x") == "神奈川県"
+        assert crawler._get_prefecture_from_url(f"{base}/99/40/3/") == "岩手県"
+
+    @patch("time.sleep")
+    def test_station_details_pref_parameter(self, mock_sleep):
+        """Test prefecture_id taken from an unpadded pref query parameter."""
+        crawler = StationCrawler()
+        mock_response = Mock()
+        mock_response.status_code = 404
+
+        with patch.object(
+            crawler.session, "get", return_value=mock_response
+        ) as mock_get:
+            details = crawler._get_station_details("/station/20042?pref=1")
+            assert details.prefecture_id == "01"
+            details = crawler._get_station_details("/station/20042?pref=99")
+            assert details.prefecture_id == "13"
+
+        # Error pages are streamed and closed without reading the body
+        assert mock_get.call_args.kwargs["stream"] is True
+        assert mock_response.close.call_count == 2
+
+    def test_station_details_line_scan_scoped_to_rail_section(self):
+        """Test the HTML line fallback ignores links outside the rail section."""
+        crawler = StationCrawler()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = (
+            "<html><body>"
+            '<div id="mdGlobalNav"><a href="/diainfo">JR線の運行情報</a></div>'
+            '<div id="mdStaRail"><dl><dt>東急目黒線</dt></dl>'
+            '<a href="/station/rail/1">東急東横線</a></div>'
+            "</body></html>"
+        ).encode()
+
+        with patch.object(crawler.session, "get", return_value=mock_response):
+            details = crawler._get_station_details("/station/22826")
+
+        assert sorted(details.all_lines) == ["東急東横線", "東急目黒線"]
+
+    def test_station_details_cache(self):
+        """Test parsed station details are cached on disk and expire."""
+        from jp_transit_search.crawler.station_crawler import StationDetailsCache
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = (
+            '<html><body><span class="staKana">しぶや</span></body></html>'
+        ).encode()
+        href = "/station/22715?pref=13"
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache_path = Path(tmp_dir) / "cache" / "details.sqlite"
+            crawler = StationCrawler()
+            crawler.details_cache = StationDetailsCache(cache_path)
+
+            with patch.object(
+                crawler.session, "get", return_value=mock_response
+            ) as mock_get:
+                first = crawler._get_station_details(href)
+                second = crawler._get_station_details(href)
+
+            assert mock_get.call_count == 1
+            assert second == first
+            assert second.station_reading == "しぶや"
+            assert second.station_id == "22715"
+            crawler.details_cache.close()
+
+            # Entries survive a reopen, and expire after the TTL
+            for ttl, expected in ((3600, first), (-1, None)):
+                cache = StationDetailsCache(cache_path, ttl=ttl)
+                assert cache.get(href) == expected
+                cache.close()
+
     @patch("time.sleep")  # Mock sleep to speed up tests
     def test_station_id_extraction_from_url(self, mock_sleep):
         """Test station ID extraction from URL patterns."""
@@ -873,7 +1207,7 @@ class TestStationDetailExtraction:
             # Mock response
             mock_response = Mock()
             mock_response.status_code = 200
-            mock_response.text = "<html><body>Test</body></html>"
+            mock_response.content = b"<html><body>Test</body></html>"
 
             with patch.object(crawler.session, "get", return_value=mock_response):
                 details = crawler._get_station_details(url)
@@ -897,7 +1231,7 @@ class TestStationDetailExtraction:
         # Mock the HTTP response to return our HTML sample
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = html_content
+        mock_response.content = html_content.encode("utf-8")
 
         with patch.object(crawler.session, "get", return_value=mock_response):
             details = crawler._get_station_details("/station/20470")
@@ -941,7 +1275,7 @@ class TestStationDetailExtraction:
         # Mock the HTTP response to return our HTML sample
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = html_content
+        mock_response.content = html_content.encode("utf-8")
 
         with patch.object(crawler.session, "get", return_value=mock_response):
             details = crawler._get_station_details("/station/23018")
@@ -994,7 +1328,7 @@ class TestStationDetailExtraction:
         # Mock the HTTP response to return our HTML sample
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = html_content
+        mock_response.content = html_content.encode("utf-8")
 
         with patch.object(crawler.session, "get", return_value=mock_response):
             details = crawler._get_station_details("/station/22826")
@@ -1010,6 +1344,9 @@ class TestStationDetailExtraction:
         assert isinstance(details.all_lines, list)
         assert len(details.all_lines) == 2
 
+        # Rail groups repeat per direction; lines keep page order without repeats
+        assert details.all_lines == ["東急東横線", "東急目黒線"]
+
         # Verify specific lines are extracted (both Tokyu lines)
         expected_lines = ["東急東横線", "東急目黒線"]
         for expected_line in expected_lines:
@@ -1041,7 +1378,7 @@ class TestStationDetailExtraction:
         # Mock the HTTP response to return our HTML sample
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = html_content
+        mock_response.content = html_content.encode("utf-8")
 
         with patch.object(crawler.session, "get", return_value=mock_response):
             details = crawler._get_station_details("/station/22715")
@@ -1098,7 +1435,7 @@ class TestStationDetailExtraction:
         # Mock the HTTP response to return our HTML sample
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.text = html_content
+        mock_response.content = html_content.encode("utf-8")
 
         with patch.object(crawler.session, "get", return_value=mock_response):
             details = crawler._get_station_details("/station/27244")
@@ -1112,11 +1449,545 @@ class TestStationDetailExtraction:
         # Test line extraction - Astram Line is a monorail with single line
         assert details.all_lines is not None
         assert isinstance(details.all_lines, list)
-        # For monorail systems, lines array might be empty as it's a single line system
-        assert len(details.all_lines) >= 0
+        # Monorail line names lack "線", so they come from the JSON rail groups
+        assert details.all_lines == ["アストラムライン"]
 
         # Verify company name extraction (Hiroshima Rapid Transit)
         assert details.company_name == "広島高速交通"
 
         # Verify line name extraction (Astram Line)
         assert details.line_name == "アストラムライン"
+
+
+class TestPageParsing:
+    """Test cases for anchor extraction on crawled listing pages."""
+
+    @pytest.fixture
+    def prefecture_html(self):
+        """Load the Tokyo prefecture listing page fixture as bytes."""
+        html_path = (
+            Path(__file__).parent.parent
+            / "fixtures"
+            / "prefecture_pages"
+            / "prefecture_東京都.html"
+        )
+        return html_path.read_bytes()
+
+    def test_extract_anchors_fallback_matches_selectolax(self, prefecture_html):
+        """Test that the selectolax and lxml anchor extractors agree."""
+        pytest.importorskip("selectolax")
+        from jp_transit_search.crawler import station_crawler
+
+        fast = station_crawler._extract_anchors(prefecture_html)
+        with patch.object(station_crawler, "SELECTOLAX_AVAILABLE", False):
+            fallback = station_crawler._extract_anchors(prefecture_html)
+
+        assert fast == fallback
+        assert ("/station/13/JR/%E5%B1%B1%E6%89%8B%E7%B7%9A", "山手線") in fast
+
+    def test_read_station_page_fallback_matches_selectolax(self):
+        """Test that the selectolax and lxml station page readers agree."""
+        pytest.importorskip("selectolax")
+        from jp_transit_search.crawler import station_crawler
+
+        station_html = (
+            Path(__file__).parent.parent
+            / "fixtures"
+            / "station_pages"
+            / "station_22715_shibuya_jr_yamanote.html"
+        ).read_bytes()
+
+        def read() -> tuple:
+            page = station_crawler._read_station_page(station_html)
+            return page.title, page.kana, page.next_data, list(page.rail_texts)
+
+        fast = read()
+        with patch.object(station_crawler, "SELECTOLAX_AVAILABLE", False):
+            fallback = read()
+
+        assert fast == fallback
+        assert fast[1] == "しぶや"
+        assert fast[3]
+
+    def test_extract_anchors_href_filter(self, prefecture_html):
+        """Test that the in-parser href filter matches a Python-side filter."""
+        from jp_transit_search.crawler import station_crawler
+
+        needle = ("/station/13/",)
+        expected = [
+            (href, text)
+            for href, text in station_crawler._extract_anchors(prefecture_html)
+            if needle[0] in href
+        ]
+        assert expected
+
+        assert station_crawler._extract_anchors(prefecture_html, needle) == expected
+        with patch.object(station_crawler, "SELECTOLAX_AVAILABLE", False):
+            assert station_crawler._extract_anchors(prefecture_html, needle) == expected
+
+    def test_iter_streamed_anchors_matches_full_parse(self, prefecture_html):
+        """Test that stream-parsing chunked HTML finds the same links."""
+        from jp_transit_search.crawler import station_crawler
+
+        needle = ("/station/13/",)
+        # Small chunks split tags and multi-byte characters across boundaries
+        chunks = [
+            prefecture_html[i : i + 1000] for i in range(0, len(prefecture_html), 1000)
+        ]
+
+        streamed = list(station_crawler._iter_streamed_anchors(chunks, needle))
+        assert streamed == station_crawler._extract_anchors(prefecture_html, needle)
+
+    def test_iter_streamed_anchors_without_meta_charset(self):
+        """Test that pages without a charset declaration are read as UTF-8."""
+        from jp_transit_search.crawler import station_crawler
+
+        html = '<html><body><a href="/station/13/1/2">JR山手線</a></body></html>'
+        data = html.encode("utf-8")
+        chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+
+        assert list(station_crawler._iter_streamed_anchors(chunks)) == [
+            ("/station/13/1/2", "JR山手線")
+        ]
+        crawler = StationCrawler(max_lines_per_prefecture=5)
+        assert crawler._collect_line_links(iter(chunks), "13") == [
+            ("JR山手線", "https://transit.yahoo.co.jp/station/13/1/2")
+        ]
+
+    def test_collect_line_links_stops_at_limit(self, prefecture_html):
+        """Test that the listing page is only read until enough lines are found."""
+        chunks = [
+            prefecture_html[i : i + 1000] for i in range(0, len(prefecture_html), 1000)
+        ]
+        consumed = []
+
+        def read_chunks():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        all_links = StationCrawler()._collect_line_links(chunks, "13")
+        crawler = StationCrawler(max_lines_per_prefecture=2)
+        line_links = crawler._collect_line_links(read_chunks(), "13")
+
+        assert line_links == all_links[:2]
+        assert len(consumed) < len(chunks)
+
+    @patch("time.sleep")
+    def test_prefecture_page_line_links(self, mock_sleep, prefecture_html):
+        """Test that line links are discovered from a prefecture page."""
+        from jp_transit_search.crawler.station_crawler import CrawlState
+
+        crawler = StationCrawler(max_lines_per_prefecture=3)
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [prefecture_html]
+
+        with (
+            patch.object(crawler.session, "get", return_value=mock_response),
+            patch.object(
+                crawler, "_parse_yahoo_line_page_resumable", return_value=[]
+            ) as mock_parse,
+        ):
+            crawler._crawl_prefecture_stations_resumable("13", "東京都", CrawlState())
+
+        # Lines are crawled concurrently, so calls may arrive in any order
+        assert mock_parse.call_count == 3
+        calls = {c.args[1]: c.args for c in mock_parse.call_args_list}
+        line_url, line_name, pref_name = calls["山手線"]
+        assert pref_name == "東京都"
+        assert line_url.startswith("https://transit.yahoo.co.jp/station/13/")
+
+    def test_prefecture_lines_merged_in_order(self, prefecture_html):
+        """Test that concurrently crawled lines are merged in line order."""
+        import time
+
+        from jp_transit_search.crawler.station_crawler import (
+            CrawlState,
+            _extract_anchors,
+        )
+
+        line_names = [
+            text
+            for href, text in _extract_anchors(prefecture_html)
+            if "/station/13/" in href and ("線" in text or "JR" in text)
+        ][:4]
+
+        crawler = StationCrawler(max_lines_per_prefecture=4)
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [prefecture_html]
+
+        def fake_parse(url, line_name, prefecture):
+            # Earlier lines finish last
+            time.sleep(0.01 * (4 - line_names.index(line_name)))
+            if line_name == line_names[1]:
+                raise ScrapingError("boom")
+            return [Station(name=f"{line_name}駅", prefecture=prefecture)]
+
+        crawl_state = CrawlState()
+        with (
+            patch.object(crawler.session, "get", return_value=mock_response),
+            patch.object(
+                crawler, "_parse_yahoo_line_page_resumable", side_effect=fake_parse
+            ),
+        ):
+            crawler._crawl_prefecture_stations_resumable("13", "東京都", crawl_state)
+
+        expected = [f"{name}駅" for i, name in enumerate(line_names) if i != 1]
+        assert [s.name for s in crawler.stations] == expected
+        assert crawler.progress.errors == 1
+        assert crawler.progress.lines_completed == 3
+        assert len(crawl_state.completed_lines["13_東京都"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_prefecture_async_matches_threaded_crawl(self, prefecture_html):
+        """Test that the asyncio crawl path merges lines like the threaded one."""
+        import zlib
+
+        from jp_transit_search.crawler.station_crawler import CrawlState
+
+        def line_page(line_url):
+            line_id = zlib.crc32(line_url.encode()) % 10_000
+            return (
+                "<html><body>"
+                f'<a href="/station/{line_id}1?pref=13&company=JR&line=x">甲{line_id}</a>'
+                f'<a href="/station/{line_id}2?pref=13&company=JR&line=x">乙{line_id}</a>'
+                "</body></html>"
+            ).encode()
+
+        async def fake_fetch(session, url):
+            if "/station/pref/" in url:
+                return 200, prefecture_html
+            if "?pref=" in url:
+                return 404, b""
+            return 200, line_page(url)
+
+        def fake_get(url, **kwargs):
+            response = Mock()
+            response.status_code = 404 if "?pref=" in url else 200
+            response.iter_content.return_value = [prefecture_html]
+            response.content = b"" if "?pref=" in url else line_page(url)
+            return response
+
+        threaded = StationCrawler(max_lines_per_prefecture=3, request_interval=0)
+        threaded_state = CrawlState()
+        with patch.object(threaded.session, "get", side_effect=fake_get):
+            threaded._crawl_prefecture_stations_resumable(
+                "13", "東京都", threaded_state
+            )
+
+        crawler = StationCrawler(max_lines_per_prefecture=3)
+        crawl_state = CrawlState()
+        with patch.object(crawler, "_fetch_async", side_effect=fake_fetch):
+            await crawler._crawl_prefecture_stations_async("13", "東京都", crawl_state)
+
+        assert len(crawler.stations) == 6
+        assert crawler.stations == threaded.stations
+        assert crawl_state.completed_lines == threaded_state.completed_lines
+        assert crawler.progress.lines_completed == 3
+
+    @pytest.mark.asyncio
+    async def test_prefecture_async_cancels_lines_when_merge_fails(
+        self, prefecture_html
+    ):
+        """Test a failing merge cancels the line crawls still in flight."""
+        import asyncio
+
+        from jp_transit_search.crawler.station_crawler import CrawlState
+
+        cancelled = []
+
+        async def fake_crawl_line(session, line_slots, detail_slots, position, *args):
+            if position.startswith("[ 1/"):
+                return []
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(position)
+                raise
+            return []
+
+        async def fake_fetch(session, url):
+            return 200, prefecture_html
+
+        crawler = StationCrawler(max_lines_per_prefecture=3)
+        with (
+            patch.object(crawler, "_fetch_async", side_effect=fake_fetch),
+            patch.object(crawler, "_crawl_line_async", side_effect=fake_crawl_line),
+            patch.object(crawler, "_complete_line", side_effect=OSError("disk full")),
+            pytest.raises(ScrapingError, match="disk full"),
+        ):
+            await crawler._crawl_prefecture_stations_async("13", "東京都", CrawlState())
+
+        assert len(cancelled) == 2
+
+    @pytest.mark.asyncio
+    async def test_station_details_async_cache_off_loop(self):
+        """Test the async details fetch reads and writes the cache in threads."""
+        import asyncio
+        import threading
+
+        threads = []
+
+        def record_thread(*args):
+            threads.append(threading.get_ident())
+
+        crawler = StationCrawler()
+        crawler.details_cache = Mock()
+        crawler.details_cache.get.side_effect = lambda href: record_thread()
+        crawler.details_cache.put.side_effect = record_thread
+
+        async def fake_fetch(session, url):
+            return 200, "<html><body><h1>渋谷</h1></body></html>".encode()
+
+        with patch.object(crawler, "_fetch_async", side_effect=fake_fetch):
+            await crawler._get_station_details_async(
+                None, asyncio.Semaphore(1), "/station/22715?pref=13"
+            )
+
+        crawler.details_cache.get.assert_called_once()
+        crawler.details_cache.put.assert_called_once()
+        assert threading.get_ident() not in threads
+
+    @patch("time.sleep")
+    def test_line_page_skips_known_stations_before_details(self, mock_sleep):
+        """Test that known stations are filtered before fetching their details."""
+        from jp_transit_search.crawler.station_crawler import StationDetails
+
+        line_html = (
+            "<html><body>"
+            '<a href="/station/22715?pref=13&company=JR&line=yamanote">渋谷</a>'
+            '<a href="/station/22741?pref=13&company=JR&line=yamanote">新宿</a>'
+            "</body></html>"
+        ).encode()
+
+        crawler = StationCrawler()
+        crawler.existing_stations = {22715}
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = line_html
+
+        with (
+            patch.object(crawler.session, "get", return_value=mock_response),
+            patch.object(
+                crawler, "_get_station_details", return_value=StationDetails()
+            ) as mock_details,
+        ):
+            crawler._parse_yahoo_line_page(
+                "https://transit.yahoo.co.jp/station/13/JR/yamanote", "山手線", "東京都"
+            )
+
+        mock_details.assert_called_once_with(
+            "/station/22741?pref=13&company=JR&line=yamanote"
+        )
+        assert [s.name for s in crawler.stations] == ["新宿"]
+        assert crawler.stations[0].station_id == "22741"
+        assert crawler.progress.duplicates_filtered == 1
+        assert 22741 in crawler.existing_stations
+
+    def test_resumable_line_page_fetches_details_in_order(self):
+        """Test that concurrent detail fetches keep the line's station order."""
+        from jp_transit_search.crawler.station_crawler import StationDetails
+
+        hrefs = [
+            f"/station/{station_id}?pref=13&company=JR&line=yamanote"
+            for station_id in ("22715", "22741", "22828")
+        ]
+        line_html = (
+            "<html><body>"
+            f'<a href="{hrefs[0]}">渋谷</a>'
+            f'<a href="{hrefs[1]}">新宿</a>'
+            f'<a href="{hrefs[2]}">東京</a>'
+            "</body></html>"
+        ).encode()
+
+        crawler = StationCrawler()
+        crawler.existing_stations = {22741}
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = line_html
+
+        def fake_details(station_href):
+            return StationDetails(all_lines=[station_href])
+
+        with (
+            patch.object(crawler.session, "get", return_value=mock_response),
+            patch.object(
+                crawler, "_get_station_details", side_effect=fake_details
+            ) as mock_details,
+        ):
+            stations = crawler._parse_yahoo_line_page_resumable(
+                "https://transit.yahoo.co.jp/station/13/JR/yamanote", "山手線", "東京都"
+            )
+
+        assert mock_details.call_count == 2
+        assert [s.name for s in stations] == ["渋谷", "東京"]
+        assert [s.all_lines for s in stations] == [[hrefs[0]], [hrefs[2]]]
+        assert [s.station_id for s in stations] == ["22715", "22828"]
+        assert crawler.progress.duplicates_filtered == 1
+
+    def test_resumable_line_page_keys_use_resolved_prefecture(self):
+        """Test that ID-less stations dedup against the prefecture from the URL."""
+        line_html = (
+            "<html><body>"
+            '<a href="/station/search?pref=13&company=JR&line=yamanote">渋谷</a>'
+            "</body></html>"
+        ).encode()
+
+        crawler = StationCrawler()
+        crawler.existing_stations = {_station_key(None, "渋谷", "東京都")}
+
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = line_html
+
+        with (
+            patch.object(crawler.session, "get", return_value=mock_response),
+            patch.object(crawler, "_get_station_details") as mock_details,
+        ):
+            stations = crawler._parse_yahoo_line_page_resumable(
+                "https://transit.yahoo.co.jp/station/13/JR/yamanote", "山手線", None
+            )
+
+        mock_details.assert_not_called()
+        assert stations == []
+        assert crawler.progress.duplicates_filtered == 1
+
+
+class TestRateLimiter:
+    """Test cases for the request rate limiter."""
+
+    @patch("jp_transit_search.crawler.station_crawler.time.sleep")
+    @patch("jp_transit_search.crawler.station_crawler.time.monotonic")
+    def test_acquire_spaces_requests(self, mock_monotonic, mock_sleep):
+        """Test that back-to-back requests wait for their reserved slot."""
+        from jp_transit_search.crawler.station_crawler import RateLimiter
+
+        mock_monotonic.return_value = 100.0
+        limiter = RateLimiter(0.5)
+
+        limiter.acquire()
+        mock_sleep.assert_not_called()
+
+        limiter.acquire()
+        limiter.acquire()
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0]
+
+    @patch("jp_transit_search.crawler.station_crawler.time.sleep")
+    @patch("jp_transit_search.crawler.station_crawler.time.monotonic")
+    def test_acquire_after_idle_does_not_wait(self, mock_monotonic, mock_sleep):
+        """Test that an idle limiter lets the next request through immediately."""
+        from jp_transit_search.crawler.station_crawler import RateLimiter
+
+        limiter = RateLimiter(0.5)
+        mock_monotonic.return_value = 100.0
+        limiter.acquire()
+        mock_monotonic.return_value = 101.0
+        limiter.acquire()
+
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_spaces_requests(self):
+        """Test that the async limiter waits on the event loop."""
+        from jp_transit_search.crawler import station_crawler
+
+        limiter = station_crawler.RateLimiter(0.5)
+        with (
+            patch.object(station_crawler.time, "monotonic", return_value=100.0),
+            patch.object(station_crawler.asyncio, "sleep") as mock_sleep,
+        ):
+            await limiter.acquire_async()
+            await limiter.acquire_async()
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5]
+
+    def test_record_backs_off_and_recovers(self):
+        """Test AIMD spacing: doubled on throttling, stepped back on success."""
+        from jp_transit_search.crawler.station_crawler import RateLimiter
+
+        limiter = RateLimiter(0.1, max_interval=0.3)
+        limiter.record(throttled=True)
+        assert limiter.interval == pytest.approx(0.2)
+        limiter.record(throttled=True)
+        assert limiter.interval == pytest.approx(0.3)
+
+        limiter.record(throttled=False)
+        assert limiter.interval == pytest.approx(0.29)
+        for _ in range(50):
+            limiter.record(throttled=False)
+        assert limiter.interval == pytest.approx(0.1)
+
+    def test_session_hook_records_adapter_retries(self):
+        """Test the session hook sees statuses retried inside the adapter."""
+        crawler = StationCrawler()
+        assert crawler._record_response in crawler.session.hooks["response"]
+
+        response = Mock()
+        response.status_code = 200
+        response.raw.retries.history = (Mock(status=429),)
+        crawler._record_response(response)
+        assert crawler.rate_limiter.interval > crawler.rate_limiter.min_interval
+
+    def test_request_interval(self):
+        """Test the crawler defaults to 1 request/second and can be configured."""
+        assert StationCrawler().rate_limiter.min_interval == 1.0
+        assert StationCrawler(request_interval=0.1).rate_limiter.min_interval == 0.1
+
+
+class TestFetchAsync:
+    """Test cases for the aiohttp page fetcher."""
+
+    class FakeResponse:
+        def __init__(self, status, body=b""):
+            self.status = status
+            self.body = body
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+        async def read(self):
+            return self.body
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_statuses(self):
+        """Test that 5xx responses are retried before the body is returned."""
+        from jp_transit_search.crawler import station_crawler
+
+        session = Mock()
+        session.get.side_effect = [
+            self.FakeResponse(503),
+            self.FakeResponse(200, b"<html></html>"),
+        ]
+        crawler = StationCrawler()
+        crawler.rate_limiter = station_crawler.RateLimiter(0)
+
+        with patch.object(station_crawler.asyncio, "sleep") as mock_sleep:
+            result = await crawler._fetch_async(session, "https://example.com/")
+
+        assert result == (200, b"<html></html>")
+        assert session.get.call_count == 2
+        mock_sleep.assert_called_once_with(1)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_retries(self):
+        """Test that the last transient status is returned once retries run out."""
+        from jp_transit_search.crawler import station_crawler
+
+        session = Mock()
+        session.get.side_effect = lambda url: self.FakeResponse(503, b"busy")
+        crawler = StationCrawler()
+
+        with patch.object(station_crawler.asyncio, "sleep"):
+            result = await crawler._fetch_async(session, "https://example.com/")
+
+        assert result == (503, b"")
+        assert session.get.call_count == station_crawler.ASYNC_FETCH_RETRIES + 1
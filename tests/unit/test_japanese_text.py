@@ -242,3 +242,24 @@ class TestJapaneseTextConverter:
         assert converter.to_katakana(normalized) == variants["katakana"]
         assert converter.to_romaji(normalized) == variants["romaji"]
         assert normalized == variants["normalized"]
+
+
+class TestGenerateTextVariants:
+    """Test cases for the cached generate_text_variants helper."""
+
+    def test_matches_converter(self):
+        """Test that cached variants match a direct conversion."""
+        from jp_transit_search.utils.japanese_text import generate_text_variants
+
+        expected = JapaneseTextConverter().generate_all_variants("渋谷")
+        assert generate_text_variants("渋谷") == expected
+        assert generate_text_variants("渋谷") == expected
+
+    def test_returns_independent_copies(self):
+        """Test that mutating a result does not affect later calls."""
+        from jp_transit_search.utils.japanese_text import generate_text_variants
+
+        first = generate_text_variants("新宿")
+        first["romaji"] = "changed"
+
+        assert generate_text_variants("新宿")["romaji"] != "changed"
@@ -0,0 +1,73 @@
+"""Tests for the JSON compatibility helpers."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from jp_transit_search.utils import json_compat
+
+
+class TestJsonLoads:
+    """Test cases for json_loads."""
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_loads_str_and_bytes(self, orjson_available):
+        """Test parsing text and bytes with either backend."""
+        if orjson_available and not json_compat.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        document = '{"name": "渋谷", "lines": ["山手線"]}'
+        with patch.object(json_compat, "ORJSON_AVAILABLE", orjson_available):
+            assert json_compat.json_loads(document) == json.loads(document)
+            assert json_compat.json_loads(document.encode()) == json.loads(document)
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_invalid_json_raises_decode_error(self, orjson_available):
+        """Test that both backends raise json.JSONDecodeError."""
+        if orjson_available and not json_compat.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        with patch.object(json_compat, "ORJSON_AVAILABLE", orjson_available):
+            with pytest.raises(json.JSONDecodeError):
+                json_compat.json_loads("")
+
+    def test_loads_str_subclass(self):
+        """Test parsing str subclasses such as BeautifulSoup strings."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup('<script>{"id": 1}</script>', "html.parser")
+        assert json_compat.json_loads(soup.script.string) == {"id": 1}
+
+
+class TestJsonDumps:
+    """Test cases for json_dumps."""
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    @pytest.mark.parametrize("indent", [True, False])
+    def test_dumps_round_trip(self, orjson_available, indent):
+        """Test that output parses back and keeps Japanese text unescaped."""
+        if orjson_available and not json_compat.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        state = {"completed_prefectures": ["東京都"], "completed_lines": {"東京都": []}}
+        with patch.object(json_compat, "ORJSON_AVAILABLE", orjson_available):
+            data = json_compat.json_dumps(state, indent=indent)
+
+        assert isinstance(data, bytes)
+        assert "東京都".encode() in data
+        assert (b"\n" in data) is indent
+        assert json.loads(data) == state
+
+    @pytest.mark.parametrize("orjson_available", [True, False])
+    def test_dumps_default(self, orjson_available):
+        """Test that unsupported objects are passed to the default hook."""
+        if orjson_available and not json_compat.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+
+        with patch.object(json_compat, "ORJSON_AVAILABLE", orjson_available):
+            data = json_compat.json_dumps([{1, 2}], default=sorted)
+            with pytest.raises(TypeError):
+                json_compat.json_dumps([{1, 2}])
+
+        assert json.loads(data) == [[1, 2]]
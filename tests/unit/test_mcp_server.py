@@ -103,6 +103,102 @@ class TestTransitMCPServer:
         handler_func = server.server.list_tools
         assert callable(handler_func)
 
+    def test_scraper_created_on_first_use(self):
+        """Test that the route scraper is only built when first needed."""
+        with (
+            patch("jp_transit_search.mcp.server.StationSearcher"),
+            patch("jp_transit_search.mcp.server.YahooTransitScraper") as scraper_cls,
+        ):
+            server = TransitMCPServer()
+            scraper_cls.assert_not_called()
+
+            assert server.scraper is scraper_cls.return_value
+            assert server.scraper is scraper_cls.return_value
+            scraper_cls.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    async def test_stations_loaded_once_on_first_query(self, sample_stations):
+        """Test that the station CSV is read lazily, once, off the event loop."""
+        import asyncio
+
+        with (
+            patch("jp_transit_search.mcp.server.StationSearcher") as searcher_cls,
+            patch(
+                "jp_transit_search.crawler.station_crawler.StationCrawler"
+            ) as crawler_cls,
+            patch("pathlib.Path.exists", return_value=True),
+        ):
+            server = TransitMCPServer()
+            crawler_cls.assert_not_called()
+
+            searcher_cls.return_value.list_stations.return_value = sample_stations
+            results = await asyncio.gather(
+                server._list_station_database({}),
+                server._list_station_database({"prefecture": "Tokyo"}),
+            )
+        server.close()
+
+        crawler_cls.return_value.load_from_csv_cached.assert_called_once()
+        searcher_cls.assert_called_once_with(
+            crawler_cls.return_value.load_from_csv_cached.return_value
+        )
+        assert all("Station Database (2 stations" in r[0].text for r in results)
+
+    @pytest.mark.asyncio
+    async def test_list_tools_reuses_definitions(self, server):
+        """Test that list_tools returns the tools built at import time."""
+        from mcp.types import ListToolsRequest
+
+        handler = server.server.request_handlers[ListToolsRequest]
+        first = await handler(ListToolsRequest(method="tools/list"))
+        second = await handler(ListToolsRequest(method="tools/list"))
+
+        names = [tool.name for tool in first.root.tools]
+        assert names == [
+            "search_route",
+            "search_stations",
+            "get_station_info",
+            "list_station_database",
+            "search_routes_batch",
+        ]
+        assert all(
+            a is b for a, b in zip(first.root.tools, second.root.tools, strict=True)
+        )
+
+    @pytest.mark.asyncio
+    async def test_call_tool_validates_arguments(self, server, sample_stations):
+        """Test that tool arguments are checked against the input schema."""
+        from mcp.types import CallToolRequest, CallToolRequestParams
+
+        handler = server.server.request_handlers[CallToolRequest]
+
+        def request(name, arguments):
+            return CallToolRequest(
+                method="tools/call",
+                params=CallToolRequestParams(name=name, arguments=arguments),
+            )
+
+        result = await handler(request("search_stations", {"limit": 5}))
+        assert result.root.isError
+        assert result.root.content[0].text == (
+            "Input validation error: 'query' is a required property"
+        )
+        server.station_searcher.search_stations.assert_not_called()
+
+        result = await handler(
+            request("search_stations", {"query": "Tokyo", "limit": 1000})
+        )
+        assert result.root.isError
+        assert "1000 is greater than the maximum of 100" in result.root.content[0].text
+
+        server.station_searcher.search_stations.return_value = sample_stations
+        result = await handler(request("search_stations", {"query": "Tokyo"}))
+        assert not result.root.isError
+        assert "Found 2 stations matching 'Tokyo'" in result.root.content[0].text
+
+        result = await handler(request("no_such_tool", {}))
+        assert result.root.content[0].text == "Unknown tool: no_such_tool"
+
     @pytest.mark.asyncio
     async def test_search_route_success(self, server, sample_route):
         """Test successful route search."""
@@ -157,6 +253,144 @@ class TestTransitMCPServer:
         assert "Route search failed" in result[0].text
         assert "No route found" in result[0].text
 
+    @pytest.mark.asyncio
+    async def test_search_route_reuses_recent_results(self, server, sample_route):
+        """Test identical route queries within the TTL share one scrape."""
+        with patch.object(
+            server.scraper, "search_route", return_value=[sample_route]
+        ) as mock_search:
+            first = await server._search_route(
+                {"from_station": "Tokyo", "to_station": "Osaka"}
+            )
+            second = await server._search_route(
+                {"from_station": " tokyo", "to_station": "OSAKA"}
+            )
+            await server._search_route(
+                {
+                    "from_station": "Tokyo",
+                    "to_station": "Osaka",
+                    "search_type": "cheapest",
+                }
+            )
+
+        assert mock_search.call_count == 2
+        assert second[1].text == first[1].text
+        assert server._route_locks == {}
+        assert server._route_lock_users == {}
+
+    @pytest.mark.asyncio
+    async def test_search_route_reuses_formatted_response(self, server, sample_route):
+        """Test a repeated query returns the already formatted content."""
+        with patch.object(
+            server.scraper, "search_route", return_value=[sample_route]
+        ) as mock_search:
+            args = {"from_station": "Tokyo", "to_station": "Osaka"}
+            first = await server._search_route(args)
+            second = await server._search_route(args)
+            other_case = await server._search_route(
+                {"from_station": "TOKYO", "to_station": "Osaka"}
+            )
+
+        mock_search.assert_called_once()
+        assert second is not first
+        assert all(a is b for a, b in zip(first, second, strict=True))
+        assert "from TOKYO to Osaka" in other_case[0].text
+        assert other_case[1] is not first[1]
+
+    @pytest.mark.asyncio
+    async def test_search_route_failures_not_cached(self, server, sample_route):
+        """Test a failed route search is retried on the next call."""
+        with patch.object(
+            server.scraper,
+            "search_route",
+            side_effect=[RouteNotFoundError("No route found"), [sample_route]],
+        ) as mock_search:
+            failed = await server._search_route(
+                {"from_station": "Tokyo", "to_station": "Osaka"}
+            )
+            result = await server._search_route(
+                {"from_station": "Tokyo", "to_station": "Osaka"}
+            )
+
+        assert "Route search failed" in failed[0].text
+        assert "Found 1 routes" in result[0].text
+        assert mock_search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_route_lock_kept_for_waiters_after_failure(
+        self, server, sample_route
+    ):
+        """Test a failed scrape does not drop the lock its waiters queue on."""
+        import asyncio
+
+        key = ("tokyo", "osaka", "earliest")
+        release = asyncio.Event()
+        locks_seen = []
+
+        async def run_blocking(func, *args, **kwargs):
+            if not locks_seen:
+                locks_seen.append(server._route_locks.get(key))
+                await release.wait()
+                raise RouteNotFoundError("No route found")
+            locks_seen.append(server._route_locks.get(key))
+            return [sample_route]
+
+        with patch.object(server, "_run_blocking", side_effect=run_blocking):
+            first = asyncio.create_task(
+                server._cached_route_search("Tokyo", "Osaka", "earliest")
+            )
+            await asyncio.sleep(0)
+            waiters = [
+                asyncio.create_task(
+                    server._cached_route_search("Tokyo", "Osaka", "earliest")
+                )
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            with pytest.raises(RouteNotFoundError):
+                await first
+            results = await asyncio.gather(*waiters)
+
+        assert results == [[sample_route], [sample_route]]
+        # The first waiter scrapes under the original lock; the second reuses it
+        assert len(locks_seen) == 2
+        assert locks_seen[0] is not None
+        assert locks_seen[1] is locks_seen[0]
+        assert server._route_locks == {}
+        assert server._route_lock_users == {}
+
+    @pytest.mark.asyncio
+    async def test_search_routes_batch(self, server, sample_route):
+        """Test batch route search scrapes pairs concurrently."""
+        import threading
+
+        # Both scrapes must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def search_route(from_station, to_station, search_type):
+            barrier.wait()
+            if to_station == "Nowhere":
+                raise RouteNotFoundError("No route found")
+            return [sample_route]
+
+        with patch.object(server.scraper, "search_route", side_effect=search_route):
+            result = await server._search_routes_batch(
+                {
+                    "pairs": [
+                        {"from_station": "Tokyo", "to_station": "Osaka"},
+                        {"from_station": "Tokyo", "to_station": "Nowhere"},
+                    ]
+                }
+            )
+
+        texts = [content.text for content in result]
+        assert texts[0] == "## Pair 1: Tokyo → Osaka"
+        assert "Found 1 routes" in texts[1]
+        assert "JSON Data:" in texts[2]
+        assert texts[3] == "## Pair 2: Tokyo → Nowhere"
+        assert "Route search failed: No route found" in texts[4]
+
     @pytest.mark.asyncio
     async def test_search_stations_success(self, server, sample_stations):
         """Test successful station search."""
@@ -176,6 +410,27 @@ class TestTransitMCPServer:
         assert "Line:" in text_content
         assert "Romaji:" in text_content
 
+    @pytest.mark.asyncio
+    async def test_search_stations_runs_off_event_loop(self, server, sample_stations):
+        """Test station searches run in a worker thread, not on the event loop."""
+        import threading
+
+        search_threads = []
+
+        def search_stations(query, limit, fuzzy_threshold):
+            search_threads.append(threading.current_thread())
+            return sample_stations
+
+        with patch.object(
+            server.station_searcher, "search_stations", side_effect=search_stations
+        ):
+            result = await server._search_stations({"query": "Tokyo"})
+        server.close()
+
+        assert "Found 2 stations" in result[0].text
+        assert search_threads and search_threads[0] is not threading.current_thread()
+        assert search_threads[0].name.startswith("transit-mcp")
+
     @pytest.mark.asyncio
     async def test_search_stations_with_exact_flag(self, server, sample_stations):
         """Test station search with exact matching."""
@@ -59,6 +59,21 @@ class TestYahooTransitScraper:
         with pytest.raises(RouteNotFoundError):
             scraper.search_route("InvalidStation", "AnotherInvalidStation")
 
+    @responses.activate
+    def test_route_page_without_charset_decoded_as_utf8(self):
+        """Test text/html responses without a charset are not read as Latin-1."""
+        responses.add(
+            responses.GET,
+            "https://transit.yahoo.co.jp/search/result",
+            body="経路が見つかりませんでした".encode(),
+            status=200,
+            content_type="text/html",
+        )
+
+        scraper = YahooTransitScraper()
+        with pytest.raises(RouteNotFoundError):
+            scraper.search_route("横浜", "豊洲")
+
     @responses.activate
     def test_successful_route_parsing(self, sample_yahoo_response):
         """Test successful route parsing."""
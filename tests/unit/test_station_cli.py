@@ -83,6 +83,34 @@ class TestStationCLICommands:
             mock_crawler.crawl_all_stations.assert_called_once()
             # CSV writing now happens incrementally within crawl_all_stations call
 
+    @patch("jp_transit_search.cli.station_commands.StationCrawler")
+    def test_crawl_command_details_cache(self, mock_crawler_class, runner):
+        """Test the crawl command's station details cache options."""
+        mock_crawler = Mock()
+        mock_crawler_class.return_value = mock_crawler
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_path = Path(temp_dir) / "stations.csv"
+            cache_path = Path(temp_dir) / "cache.sqlite"
+            runner.invoke(
+                stations,
+                [
+                    "crawl",
+                    "--output",
+                    str(output_path),
+                    "--cache-file",
+                    str(cache_path),
+                ],
+            )
+            kwargs = mock_crawler.crawl_all_stations.call_args.kwargs
+            assert kwargs["details_cache_path"] == cache_path
+
+            runner.invoke(
+                stations, ["crawl", "--output", str(output_path), "--no-cache"]
+            )
+            kwargs = mock_crawler.crawl_all_stations.call_args.kwargs
+            assert kwargs["details_cache_path"] is None
+
     @patch("jp_transit_search.cli.station_commands.StationCrawler")
     def test_crawl_command_error(self, mock_crawler_class, runner):
         """Test station crawling with error."""